@@ -10,8 +10,6 @@ USSSNDetector,
 IBANDetector,
 HighEntropyTokenDetector,
 )
-from .policy.loader import load_policy
-from .policy.engine import apply_policy
 
 
 # --------------------------------------------------------------------
@@ -31,19 +29,37 @@ def apply(data: str, policy: str | None = None, *, region: str = "GB") -> str:
 
     Returns:
     The transformed text after applying the policy. If no policy is
-    provided, detection runs but the original text is returned unchanged.
+    provided, the original text is returned unchanged without scanning.
     """
+    if not policy:
+        return data
+    # Deferred so the scan-only path never imports the policy
+    # subsystem (YAML parser, pydantic models, engine).
+    from .policy.engine import apply_policy
+    from .policy.loader import load_policy
+
     registry = DetectorRegistry.default(region=region)
-    findings = list(registry.scan(data))
-    if policy:
-        pol = load_policy(policy)
-        return apply_policy(pol, findings, data)
-    return data
+    pol = load_policy(policy)
+    # Only run the detectors whose kinds the policy actually rewrites.
+    findings = registry.scan(data, kinds=pol.referenced_fields())
+    return apply_policy(pol, findings, data)
 
 
 # --------------------------------------------------------------------
 # Public API
 
+# Policy names resolvable at top level without importing the policy
+# subsystem until first access (PEP 562).
+_POLICY_EXPORTS = frozenset({"Policy", "Rule", "load_policy", "apply_policy"})
+
+
+def __getattr__(name: str):
+    if name in _POLICY_EXPORTS:
+        from . import policy
+
+        return getattr(policy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
 "Finding",
@@ -1,26 +1,60 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
 import sys
 
-from redactable.detectors import DetectorRegistry
-from redactable.policy.engine import apply_policy
-from redactable.policy.loader import load_policy
+import redactable
+
+# Passthrough copy size for file input without a policy.
+_COPY_CHUNK = 1 << 20
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="redactable")
     parser.add_argument("--policy", "-p", required=False, help="Path to YAML/JSON policy")
     parser.add_argument("--region", default="GB", help="Default phone region (e.g. GB, US)")
+    parser.add_argument(
+        "--input", "-i", required=False, metavar="PATH",
+        help="Read from a file (memory-mapped) instead of stdin",
+    )
     args = parser.parse_args(argv)
 
-    text = sys.stdin.read()
-    registry = DetectorRegistry.default(region=args.region)
-    findings = list(registry.scan(text))
-
-    policy = load_policy(args.policy) if args.policy else None
-    output = apply_policy(policy, findings, text) if policy else text
-    sys.stdout.write(output)
+    out_buf = sys.stdout.buffer
+    if args.input:
+        # Map the file instead of reading it: the kernel pages it in on
+        # demand and the no-policy path never copies it into the heap.
+        fd = os.open(args.input, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:  # mmap rejects empty files
+                return 0
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if args.policy:
+                    # str(buffer, ...) decodes straight from the mapped
+                    # pages; no intermediate bytes object.
+                    text = str(mm, "utf-8", "replace")
+                    out_buf.write(
+                        redactable.apply(text, args.policy, region=args.region).encode("utf-8")
+                    )
+                else:
+                    for off in range(0, len(mm), _COPY_CHUNK):
+                        out_buf.write(mm[off:off + _COPY_CHUNK])
+        finally:
+            os.close(fd)
+        out_buf.flush()
+        return 0
+
+    # Read/write raw bytes and decode/encode exactly once at the
+    # boundary, skipping the io text layer's incremental codec.
+    raw = sys.stdin.buffer.read()
+    if args.policy:
+        text = raw.decode("utf-8", errors="replace")
+        out = redactable.apply(text, args.policy, region=args.region).encode("utf-8")
+    else:
+        out = raw
+    out_buf.write(out)
+    out_buf.flush()
     return 0
 
 
@@ -1 +1,47 @@
-def redactable_io(policy): . . .
+"""
+Decorators.
+
+redactable_io wraps a function so that any string it returns is scanned
+and transformed through a policy. The detector registry and policy are
+resolved once at decoration time, so the per-call cost is scan + apply.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+from .detectors.registry import DetectorRegistry
+from .policy.engine import apply_policy
+from .policy.loader import load_policy
+from .policy.model import Policy
+
+
+def redactable_io(policy: Policy | str | Path | None = None, *, region: str = "GB"):
+    """
+    Decorator: redact a function's string return value.
+
+    Args:
+        policy: A Policy instance or a path to a YAML/JSON policy file.
+        region: Default region for phone parsing (e.g., "GB", "US").
+
+    Non-string return values pass through untouched, as do all results
+    when no policy is given.
+    """
+    registry = DetectorRegistry.default(region=region)
+    pol = load_policy(policy) if isinstance(policy, (str, Path)) else policy
+    # The policy names every kind it acts on; scanning for anything else
+    # is wasted work on every call.
+    kinds = frozenset(pol.referenced_fields()) if pol is not None else None
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if pol is None or not isinstance(result, str):
+                return result
+            findings = registry.scan(result, kinds)
+            return apply_policy(pol, findings, result)
+        return wrapper
+
+    return decorate
@@ -16,6 +16,7 @@ from .regexes import (
     NHSNumberDetector,
     USSSNDetector,
     IBANDetector,
+    NumericPIIDetector,
 )
 from .entropy import HighEntropyTokenDetector
 from . import email, credit_card, iban, nhs, ssn, phone, entropy, schema_hints  # noqa: F401
@@ -30,5 +31,6 @@ __all__ = [
     "NHSNumberDetector",
     "USSSNDetector",
     "IBANDetector",
+    "NumericPIIDetector",
     "HighEntropyTokenDetector",
 ]
@@ -7,9 +7,10 @@ Contents:
 - Shared helper functions: digits_only, luhn_ok, guess_card_brand.
 """
 
+import sys
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Iterable, Optional, Protocol, Tuple, Dict, Any
-import re
 
 # --------------------------------------------------------------------
 # Shared type aliases
@@ -29,6 +30,11 @@ class Match:
     confidence: float = 1.0  # 0..1
     meta: dict[str, Any] = None
 
+    def __post_init__(self) -> None:
+        # Labels repeat constantly; intern so downstream comparisons and
+        # dict lookups hit the identity fast path.
+        self.label = sys.intern(self.label)
+
 class Detector(Protocol):
     name: str
     labels: tuple[str, ...]
@@ -39,9 +45,14 @@ _REGISTRY: Dict[str, Detector] = {}
 _LABEL_TO_DETECTORS: Dict[str, List[str]] = {}
 
 def register(detector: Detector) -> None:
+    # Idempotent: re-importing a detector module (or registering a
+    # replacement under the same name) must not leave duplicate label
+    # entries, which would double every scan over that label.
     _REGISTRY[detector.name] = detector
     for label in detector.labels:
-        _LABEL_TO_DETECTORS.setdefault(label, []).append(detector.name)
+        names = _LABEL_TO_DETECTORS.setdefault(label, [])
+        if detector.name not in names:
+            names.append(detector.name)
 
 def get(name: str) -> Detector:
     return _REGISTRY[name]
@@ -52,6 +63,11 @@ def detectors_for(label: str) -> list[Detector]:
 def all_detectors() -> list[Detector]:
     return list(_REGISTRY.values())
 
+# Shared read-only default for findings without metadata, so the common
+# case skips a per-instance dict allocation.
+_EMPTY_EXTRAS: Extras = MappingProxyType({})
+
+
 @dataclass(slots=True)
 class Finding:
     """
@@ -73,10 +89,14 @@ class Finding:
     extras: Extras | None = None
 
     def __post_init__(self) -> None:
-        if not (0.0 <= self.confidence <= 1.0):
-            raise ValueError("confidence must be between 0 and 1")
+        # Constructed in detector hot loops; keep the range check out of
+        # optimized runs.
+        assert 0.0 <= self.confidence <= 1.0, "confidence must be between 0 and 1"
+        # Kinds come from a tiny fixed vocabulary; interning makes the
+        # policy engine's per-kind dict probes identity-fast.
+        self.kind = sys.intern(self.kind)
         if self.extras is None:
-            self.extras = {}
+            self.extras = _EMPTY_EXTRAS
 
     def __str__(self) -> str:
         return f"<Finding {self.kind} value='{self.value}' conf={self.confidence:.2f}>"
@@ -94,11 +114,35 @@ class Detector(Protocol):
 # --------------------------------------------------------------------
 # Shared helpers
 
-_DIGITS = re.compile(r"\\D+")
+# Deletion table covering Latin-1; anything above that range (which the
+# str-mode \d patterns can match: Arabic-Indic digits etc.) is handled
+# by the fold below.
+_NON_DIGITS_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+
+def _fold_decimal_digits(s: str) -> str:
+    """
+    Fold Unicode decimal digits to their ASCII equivalents and drop
+    every other character. Only the rare non-ASCII candidate pays for
+    this; int() reads the digit's decimal value regardless of script.
+    """
+    return "".join(chr(48 + int(c)) for c in s if c.isdecimal())
+
 
 def digits_only(s: str) -> str:
-    """Strip all non-digit characters from a string."""
-    return _DIGITS.sub("", s)
+    """Strip all non-digit characters; non-ASCII digits fold to ASCII."""
+    out = s.translate(_NON_DIGITS_TABLE)
+    if not out.isascii():
+        # The ord-arithmetic validators index tables by ord(c) - 48;
+        # a "٤" slipping through would crash them, so normalize here,
+        # at the single choke point every candidate passes.
+        out = _fold_decimal_digits(out)
+    return out
+
+# Doubled-digit lookup: 2*d with the "subtract 9 above 9" fold applied.
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
 def luhn_ok(num: str) -> bool:
     """
@@ -108,51 +152,61 @@ def luhn_ok(num: str) -> bool:
     d = digits_only(num)
     if len(d) < 12:
         return False
-    total = 0
-    alt = False
-    for ch in reversed(d):
-        x = ord(ch) - 48
-        if alt:
-            x *= 2
-            if x > 9:
-                x -= 9
-        total += x
-        alt = not alt
+    # Split the odd/even positions with slices instead of flipping a
+    # flag per digit: two straight-line reductions, no branches.
+    total = sum(map(ord, d[-1::-2])) - 48 * ((len(d) + 1) // 2)
+    dbl = _LUHN_DOUBLE
+    total += sum(dbl[ord(c) - 48] for c in d[-2::-2])
     return total % 10 == 0
 
+def _build_brand_table() -> dict[int, tuple[tuple[str, frozenset[int] | None], ...]]:
+    """
+    Enumerate every 4-digit prefix and record which brand rules accept
+    it, in the same precedence order as the old startswith cascade.
+    A `None` length set means the rule matches any PAN length.
+    """
+    table: dict[int, tuple[tuple[str, frozenset[int] | None], ...]] = {}
+    for p in range(10000):
+        s = f"{p:04d}"
+        p2 = s[:2]
+        rules: list[tuple[str, frozenset[int] | None]] = []
+        if s[0] == "4":
+            rules.append(("visa", frozenset({13, 16, 19})))
+        if 51 <= int(p2) <= 55 or 2221 <= p <= 2720:
+            rules.append(("mastercard", frozenset({16})))
+        if p2 in ("34", "37"):
+            rules.append(("amex", frozenset({15})))
+        if p2 == "35":
+            rules.append(("jcb", frozenset({16})))
+        if s == "6011" or p2 in ("64", "65"):
+            rules.append(("discover", None))
+        if s in ("3000", "3050", "3095") or p2 in ("36", "38"):
+            rules.append(("diners_club", None))
+        if p2 in ("50", "56", "57", "58", "63", "67"):
+            rules.append(("maestro", None))
+        if p2 == "62":
+            rules.append(("unionpay", None))
+        if rules:
+            table[p] = tuple(rules)
+    return table
+
+_BRAND_BY_PREFIX4 = _build_brand_table()
+
 def guess_card_brand(pan: str) -> str | None:
     """
     Make a naive guess of card brand from PAN digits.
     Not exhaustive — just common prefixes and lengths.
     """
     d = digits_only(pan)
-
-    if d.startswith("4") and len(d) in (13, 16, 19):
-        return "visa"
-
-    if d[:2].isdigit() and 51 <= int(d[:2]) <= 55 and len(d) == 16:
-        return "mastercard"
-    if d[:4].isdigit() and 2221 <= int(d[:4]) <= 2720 and len(d) == 16:
-        return "mastercard"
-
-    if d.startswith(("34", "37")) and len(d) == 15:
-        return "amex"
-
-    if d.startswith("35") and len(d) == 16:
-        return "jcb"
-
-    if d.startswith("6011") or d.startswith(("64", "65")):
-        return "discover"
-
-    if d[:4] in {"3000", "3050", "3095"} or d[:2] in {"36", "38"}:
-        return "diners_club"
-
-    if d.startswith(("50", "56", "57", "58", "63", "67")):
-        return "maestro"
-
-    if d.startswith("62"):
-        return "unionpay"
-
+    if len(d) < 4:
+        return None
+    rules = _BRAND_BY_PREFIX4.get(int(d[:4]))
+    if rules is None:
+        return None
+    n = len(d)
+    for brand, lengths in rules:
+        if lengths is None or n in lengths:
+            return brand
     return None
 
 
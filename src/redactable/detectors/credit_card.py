@@ -1,36 +1,51 @@
-import re
-from .base import Match, register
-from .utils import luhn_check
+from .base import Match, register, digits_only
+from .utils import luhn_check, compile_linear, contains_digit
 
-# Match 13–19 digits allowing optional single space/hyphen separators.
-# Capture the whole thing; we'll strip non-digits before Luhn.
-_PAN = re.compile(r'(?<!\d)((?:\d[ -]?){13,19})(?!\d)')
+# Match 13–19 digits allowing optional single space/hyphen separators;
+# non-digits are stripped before Luhn. The boundaries are zero-width so
+# the whole-match span is the candidate.
+_PAN_EXPR = r'(?<!\d)(?:\d[ -]?){13,19}(?!\d)'
+_PAN = compile_linear(_PAN_EXPR)
+
+# Mastercard's classic 2-digit prefixes; built once, not per call.
+_MC_PREFIX_2 = frozenset({"51", "52", "53", "54", "55"})
 
 def _brand(digits: str) -> str | None:
-    if digits.startswith('4') and len(digits) in (13, 16, 19):
+    n = len(digits)
+    if digits.startswith('4') and n in (13, 16, 19):
         return "VISA"
-    if digits[:2] in {str(i) for i in range(51, 56)} or (len(digits) >= 4 and 2221 <= int(digits[:4]) <= 2720):
-        if len(digits) == 16:
-            return "MASTERCARD"
-    if digits.startswith(('34', '37')) and len(digits) == 15:
+    # Length first: skips the prefix probe and the int parse of the
+    # 2221-2720 range for every non-16-digit candidate.
+    if n == 16 and (digits[:2] in _MC_PREFIX_2 or 2221 <= int(digits[:4]) <= 2720):
+        return "MASTERCARD"
+    if digits.startswith(('34', '37')) and n == 15:
         return "AMEX"
     return None
 
 class CreditCardDetector:
     name = "credit_card"
     labels = ("CREDIT_CARD",)
+    pattern = _PAN_EXPR
 
     def detect(self, text: str, *, context=None):
+        if not contains_digit(text):
+            return
         for m in _PAN.finditer(text):
-            raw = m.group(1)
-            digits = ''.join(ch for ch in raw if ch.isdigit())
-            if 13 <= len(digits) <= 19 and luhn_check(digits):
-                yield Match(
-                    label="CREDIT_CARD",
-                    start=m.start(1), end=m.end(1),
-                    value=raw,
-                    confidence=0.98,
-                    meta={"digits": digits, "brand": _brand(digits)}
-                )
+            res = self.match_at(text, *m.span())
+            if res is not None:
+                yield res
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        raw = text[start:end]
+        digits = digits_only(raw)
+        if 13 <= len(digits) <= 19 and luhn_check(digits):
+            return Match(
+                label="CREDIT_CARD",
+                start=start, end=end,
+                value=raw,
+                confidence=0.98,
+                meta={"digits": digits, "brand": _brand(digits)}
+            )
+        return None
 
 register(CreditCardDetector())
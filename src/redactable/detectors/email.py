@@ -1,20 +1,32 @@
-import re
 from .base import Match, Detector, register
+from .utils import compile_linear
 
-_EMAIL = re.compile(
+# Boundaries are zero-width lookarounds, so no capture group is needed:
+# the whole-match span is the address.
+_EMAIL_EXPR = (
     r'(?<![A-Za-z0-9._%+-])'     # left boundary
-    r'([A-Za-z0-9._%+-]+@'       # local
-    r'(?:[A-Za-z0-9-]+\.)+'      # subdomains
-    r'[A-Za-z]{2,63})'           # TLD
+    r'[A-Za-z0-9._%+-]+@'        # local
+    r'(?:[A-Za-z0-9-]+\.)+'     # subdomains
+    r'[A-Za-z]{2,63}'            # TLD
     r'(?![A-Za-z0-9._%+-])'      # right boundary
 )
+_EMAIL = compile_linear(_EMAIL_EXPR)
 
 class EmailDetector:
     name = "email"
     labels = ("EMAIL",)
+    # Branch for the combined run_all alternation; lookarounds are
+    # zero-width so the branch span equals the old capture group.
+    pattern = _EMAIL_EXPR
 
     def detect(self, text: str, *, context=None):
+        if '@' not in text:  # memmem beats entering the engine
+            return
         for m in _EMAIL.finditer(text):
-            yield Match(label="EMAIL", start=m.start(1), end=m.end(1), value=m.group(1), confidence=0.95)
+            # One span() call per hit; the value comes from a slice.
+            yield self.match_at(text, *m.span())
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        return Match(label="EMAIL", start=start, end=end, value=text[start:end], confidence=0.95)
 
 register(EmailDetector())
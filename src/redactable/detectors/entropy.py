@@ -11,12 +11,32 @@ Detects high-entropy strings (likely secrets, tokens, API keys).
 Intended as a complement to regex-based detectors.
 """
 
-import re
+from collections import Counter
 from .base import Match, register, Finding, Detector
-from .utils import shannon_entropy, looks_like_secret
+from .utils import shannon_entropy, looks_like_secret, compile_linear, entropy_if_at_least
 from typing import Iterable
 import math
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None
+
+if np is not None:
+    # c * log2(c) for every histogram count a token under 64 KiB can
+    # produce; turns the per-bin log into a table gather.
+    _c = np.arange(1, 1 << 16, dtype=np.float64)
+    _XLOGX = np.concatenate(([0.0], _c * np.log2(_c)))
+    del _c
+
+# Below this length the numpy call overhead outweighs its vectorized
+# counting; short tokens stay on the Counter path.
+_NUMPY_MIN_LEN = 64
+
+# c * log2(c) for every count a typical token can produce; counts past
+# the table fall back to computing the product directly.
+_CLOGC = [0.0] + [i * math.log2(i) for i in range(1, 1025)]
+
 
 # --------------------------------------------------------------------
 # Helpers
@@ -26,23 +46,42 @@ def shannon_entropy(s: str) -> float:
     Calculate Shannon entropy of a string.
     Returns a value >= 0, higher means more random.
     """
-    if not s:
-        return 0.0
-    freq = {ch: s.count(ch) for ch in set(s)}
     n = len(s)
-    return -sum((c/n) * math.log2(c/n) for c in freq.values())
+    if not n:
+        return 0.0
+    if np is not None and n >= _NUMPY_MIN_LEN and s.isascii():
+        arr = np.frombuffer(s.encode("ascii"), dtype=np.uint8)
+        if n < (1 << 16):
+            # Integer histogram, then one gather from the x*log2(x)
+            # table: no per-symbol division, floats only at reduction.
+            hist = np.bincount(arr, minlength=256)
+            return math.log2(n) - float(_XLOGX[hist].sum()) / n
+        _, counts = np.unique(arr, return_counts=True)
+        p = counts / arr.size
+        return float(-(p * np.log2(p)).sum())
+    # -sum((c/n)*log2(c/n)) == log2(n) - sum(c*log2(c))/n, which drops
+    # the per-symbol division and lets c*log2(c) come from a table.
+    if s.isascii():
+        # bytes.count is a vectorized C scan; for the short tokens this
+        # path sees, one scan per unique symbol beats iterating every
+        # character through Counter's Python-object machinery.
+        b = s.encode("ascii")
+        counts = [b.count(x) for x in set(b)]
+    else:
+        counts = Counter(s).values()
+    clogc = _CLOGC
+    total = sum(
+        clogc[c] if c <= 1024 else c * math.log2(c)
+        for c in counts
+    )
+    return math.log2(n) - total / n
 
 # --------------------------------------------------------------------
 # Regex pattern: matches candidate secrets
-BASELIKE_PATTERN = re.compile(
-    r"""
-    (                             # capture group
-      [A-Za-z0-9+/=]{24,}          # base64-ish
-      |[A-HJ-NP-Za-km-z1-9]{24,}   # base58-ish
-      |[A-Fa-f0-9]{32,}            # long hex strings
-    )
-    """,
-    re.VERBOSE,
+# (base64-ish | base58-ish | long hex); kept flag-free so it can run on
+# a linear-time engine.
+BASELIKE_PATTERN = compile_linear(
+    r"[A-Za-z0-9+/=]{24,}|[A-HJ-NP-Za-km-z1-9]{24,}|[A-Fa-f0-9]{32,}"
 )
 
 # --------------------------------------------------------------------
@@ -57,10 +96,14 @@ class HighEntropyTokenDetector:
         min_len: minimum string length to consider.
     """
     name = "high_entropy_token"
+    expression = r"[A-Za-z0-9+/=]{24,}|[A-HJ-NP-Za-km-z1-9]{24,}|[A-Fa-f0-9]{32,}"
 
     def __init__(self, entropy_threshold: float = 3.5, min_len: int = 24) -> None:
         self.entropy_threshold = entropy_threshold
         self.min_len = min_len
+        # Inputs shorter than one token can't match; lets the registry
+        # prefilter skip this detector outright.
+        self.min_input_len = min_len
 
     def detect(self, text: str) -> Iterable[Finding]:
         """
@@ -68,39 +111,54 @@ class HighEntropyTokenDetector:
         Yields Finding objects for each match.
         """
         for m in BASELIKE_PATTERN.finditer(text):
-            raw = m.group(0)
-            if len(raw) < self.min_len:
-                continue
-            ent = shannon_entropy(raw)
-            if ent >= self.entropy_threshold:
-                yield Finding(
-                    kind=self.name,
-                    value=raw,
-                    span=m.span(),
-                    confidence=min(0.99, 0.5 + ent / 8),
-                    normalized=raw,
-                    extras={"entropy": ent},
-                )
+            f = self.finding_at(text, *m.span())
+            if f is not None:
+                yield f
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding | None:
+        """Score a candidate span and build a Finding if entropy is high enough."""
+        raw = text[start:end]
+        if len(raw) < self.min_len:
+            return None
+        ent = shannon_entropy(raw)
+        if ent < self.entropy_threshold:
+            return None
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=min(0.99, 0.5 + ent / 8),
+            normalized=raw,
+            extras={"entropy": ent},
+        )
 
 
 # Tokens separated by non-word; allow -,_,= typical in JWT/base64url
-_TOKEN = re.compile(r'([A-Za-z0-9_\-=+/]{20,})')
+_TOKEN_EXPR = r'[A-Za-z0-9_\-=+/]{20,}'
+_TOKEN = compile_linear(_TOKEN_EXPR)
 
 class EntropyDetector:
     name = "entropy"
     labels = ("SECRET",)
+    pattern = _TOKEN_EXPR
 
     def __init__(self, *, threshold: float = 3.5):
         self.threshold = threshold
 
     def detect(self, text: str, *, context=None):
-        threshold = (context or {}).get("entropy_threshold", self.threshold)
         for m in _TOKEN.finditer(text):
-            token = m.group(1)
-            if not looks_like_secret(token):
-                continue
-            H = shannon_entropy(token)
-            if H >= threshold:
-                yield Match("SECRET", m.start(1), m.end(1), token, min(0.99, 0.7 + (H-threshold)/4), {"entropy": H})
+            res = self.match_at(text, *m.span(), context=context)
+            if res is not None:
+                yield res
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        threshold = (context or {}).get("entropy_threshold", self.threshold)
+        token = text[start:end]
+        if not looks_like_secret(token):
+            return None
+        H = entropy_if_at_least(token, threshold)
+        if H is None:
+            return None
+        return Match("SECRET", start, end, token, min(0.99, 0.7 + (H-threshold)/4), {"entropy": H})
 
 register(EntropyDetector())
\ No newline at end of file
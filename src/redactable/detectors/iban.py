@@ -1,17 +1,28 @@
-import re
 from .base import Match, register
-from .utils import iban_check
+from .utils import iban_check, compile_linear, contains_digit
 
-_IBAN = re.compile(r'\b([A-Z]{2}\d{2}[A-Z0-9]{11,30})\b', re.I)
+# Case classes are inlined instead of re.I so the flag-free pattern is
+# usable by linear engines and the combined alternation alike.
+_IBAN_EXPR = r'\b[A-Za-z]{2}\d{2}[A-Za-z0-9]{11,30}\b'
+_IBAN = compile_linear(_IBAN_EXPR)
 
 class IBANDetector:
     name = "iban"
     labels = ("IBAN",)
+    pattern = _IBAN_EXPR
 
     def detect(self, text: str, *, context=None):
+        if not contains_digit(text):  # check digits are mandatory
+            return
         for m in _IBAN.finditer(text):
-            token = m.group(1).upper()
-            if iban_check(token):
-                yield Match("IBAN", m.start(1), m.end(1), token, 0.98, {"country": token[:2]})
+            res = self.match_at(text, *m.span())
+            if res is not None:
+                yield res
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        token = text[start:end].upper()
+        if iban_check(token):
+            return Match("IBAN", start, end, token, 0.98, {"country": token[:2]})
+        return None
 
 register(IBANDetector())
@@ -1,19 +1,28 @@
-import re
-from .base import Match, register
-from .utils import nhs_check
+from .base import Match, register, digits_only
+from .utils import nhs_check, compile_linear, contains_digit
 
 # Accept formats: 10 digits with optional spaces
-_NHS = re.compile(r'\b((?:\d\s*){10})\b')
+_NHS_EXPR = r'\b(?:\d\s*){10}\b'
+_NHS = compile_linear(_NHS_EXPR)
 
 class NHSDetector:
     name = "nhs"
     labels = ("NHS_NUMBER",)
+    pattern = _NHS_EXPR
 
     def detect(self, text: str, *, context=None):
+        if not contains_digit(text):
+            return
         for m in _NHS.finditer(text):
-            raw = m.group(1)
-            digits = ''.join(ch for ch in raw if ch.isdigit())
-            if nhs_check(digits):
-                yield Match("NHS_NUMBER", m.start(1), m.end(1), raw, 0.99, {"digits": digits})
+            res = self.match_at(text, *m.span())
+            if res is not None:
+                yield res
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        raw = text[start:end]
+        digits = digits_only(raw)
+        if nhs_check(digits):
+            return Match("NHS_NUMBER", start, end, raw, 0.99, {"digits": digits})
+        return None
 
 register(NHSDetector())
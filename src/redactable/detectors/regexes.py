@@ -17,9 +17,11 @@ Design:
 """
 
 import re
+from functools import lru_cache
 from typing import Iterable, Dict, Any
 
 from .base import Finding, Detector, digits_only, luhn_ok, guess_card_brand
+from .utils import _ASCIIDispatchPattern, _re2_supports
 
 # --------------------------------------------------------------------
 # Optional external dependencies (gracefully degrade if missing)
@@ -41,50 +43,194 @@ try:
     from stdnum.us import ssn as std_us_ssn  # type: ignore
 except Exception:  # pragma: no cover
     std_iban = std_nhs = std_us_ssn = None
+try:
+    import pcre2  # type: ignore
+except Exception:  # pragma: no cover
+    pcre2 = None
+try:
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None
+
+# --------------------------------------------------------------------
+# Regex engine selection
+#
+# The prefilter patterns are compiled once at import and reused across
+# every scan, so JIT compilation cost is amortized. When the optional
+# `pcre2` bindings are installed, flag-free patterns go through
+# PCRE2-JIT; everything else (and every environment without the
+# bindings) uses the stdlib `re` engine.
+
+
+class _PCRE2Match:
+    """Adapt a PCRE2 match to the subset of `re.Match` the detectors use."""
+
+    __slots__ = ("_m",)
+
+    def __init__(self, m) -> None:
+        self._m = m
+
+    def span(self) -> tuple[int, int]:
+        return (self._m.start(), self._m.end())
+
+    def group(self, index: int = 0) -> str:
+        return self._m.substring()
+
+
+class _PCRE2Pattern:
+    """`finditer`-compatible shim over a PCRE2-JIT compiled pattern."""
+
+    __slots__ = ("_pattern",)
+
+    def __init__(self, pattern) -> None:
+        self._pattern = pattern
+
+    def finditer(self, text: str):
+        for m in self._pattern.scan(text):
+            yield _PCRE2Match(m)
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile with the best available engine: google-re2 first (linear
+    time, immune to catastrophic backtracking on the nested optional
+    groups in the email/phone shapes), then PCRE2-JIT, then stdlib
+    `re`. Engines that reject a construct fall through per pattern.
+    Both fast engines treat \\d/\\w/\\b as ASCII-only where str-mode
+    `re` is Unicode-aware, so they scan ASCII inputs only; non-ASCII
+    text dispatches to a stdlib twin and results match plain `re`.
+    """
+    if flags == 0:
+        # Lookarounds are rejected by re2's parser, which logs the
+        # error to stderr before raising; screen them out rather than
+        # letting every import print absl noise.
+        if re2 is not None and _re2_supports(pattern):
+            try:
+                return _ASCIIDispatchPattern(
+                    re2.compile(pattern), re.compile(pattern)
+                )
+            except Exception:
+                pass
+        if pcre2 is not None:
+            try:
+                return _ASCIIDispatchPattern(
+                    _PCRE2Pattern(pcre2.compile(pattern, jit=True)),
+                    re.compile(pattern),
+                )
+            except Exception:  # unsupported construct or binding mismatch
+                pass
+    return re.compile(pattern, flags)
+
 
 # --------------------------------------------------------------------
 # Regex patterns (baseline filters)
 
 # Regex pattern: not fully RFC 5322 (too heavy) but good 95% case
-RE_EMAIL = re.compile(
-    r"""
-    (?P<email>
-      [a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+
-      @
-      [a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?
-      (?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+
-    )
-    """,
-    re.VERBOSE)
+_EMAIL_EXPR = (
+    r"[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+"
+)
+RE_EMAIL = _compile(_EMAIL_EXPR)
 
 # PAN: 13–19 digits, spaces/dashes optional
-RE_CARD = re.compile(r"(?:\b(?:\d[ -]?){13,19}\b)")
+RE_CARD = _compile(r"(?:\b(?:\d[ -]?){13,19}\b)")
+
+# Pre-folded doubled digits for the vectorized Luhn lane; batches below
+# the threshold stay on the scalar loop (array setup costs more).
+_NP_LUHN_DOUBLE = (
+    np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.int64)
+    if np is not None else None
+)
+_LUHN_BATCH_MIN = 64
 
 class CreditCardDetector:
     """Detect payment card PANs via regex + Luhn + brand guess."""
     name = "credit_card"
+    # Single-line pattern source for multi-pattern engines (Hyperscan).
+    expression = r"\b(?:\d[ -]?){13,19}\b"
+    requires_digits = True
 
-    def detect(self, text: str) -> Iterable[Finding]:
-        for m in RE_CARD.finditer(text):
-            raw = m.group(0)
-            digits = digits_only(raw)
+    def __init__(self, min_confidence: float = 0.0) -> None:
+        # Optional gate: hits scoring below it are dropped before the
+        # Finding (and its extras dict) is ever allocated — noisy logs
+        # produce far more low-confidence shapes than real PANs.
+        self.min_confidence = min_confidence
 
-            # Quick reject obvious bad lengths
-            if not (13 <= len(digits) <= 19):
-                continue
+    def detect(self, text: str) -> Iterable[Finding]:
+        if np is None:
+            for m in RE_CARD.finditer(text):
+                f = self.finding_at(text, *m.span())
+                if f is not None:
+                    yield f
+            return
 
-            ok = luhn_ok(digits)
-            brand = guess_card_brand(digits)
-            conf = 0.9 if ok else 0.4
+        cands: list[tuple[int, int, str, str]] = []
+        strip = digits_only  # local binding for the hot loop
+        for m in RE_CARD.finditer(text):
+            start, end = m.span()
+            raw = text[start:end]
+            digits = strip(raw)
+            if 13 <= len(digits) <= 19:
+                cands.append((start, end, raw, digits))
+        if len(cands) < _LUHN_BATCH_MIN:
+            for start, end, raw, digits in cands:
+                f = self._finding(raw, start, end, digits, luhn_ok(digits))
+                if f is not None:
+                    yield f
+            return
 
-            yield Finding(
-                kind=self.name,
-                value=raw,
-                span=m.span(),
-                confidence=conf,
-                normalized=digits,
-                extras={"luhn_valid": ok, "brand": brand},
+        # Structure-of-arrays Luhn: left-pad every candidate to 19 with
+        # '0' (zero digits are Luhn-neutral) so position-from-the-right
+        # is preserved, then validate the whole batch in a few
+        # vectorized passes instead of one Python loop per hit.
+        rows = (
+            np.frombuffer(
+                "".join(c[3].rjust(19, "0") for c in cands).encode("ascii"),
+                dtype=np.uint8,
             )
+            .reshape(-1, 19)
+            .astype(np.int64)
+            - 48
+        )
+        totals = rows[:, ::2].sum(axis=1) + _NP_LUHN_DOUBLE[rows[:, 1::2]].sum(axis=1)
+        ok_mask = (totals % 10) == 0
+        for (start, end, raw, digits), ok in zip(cands, ok_mask):
+            f = self._finding(raw, start, end, digits, bool(ok))
+            if f is not None:
+                yield f
+
+    def _finding(
+        self, raw: str, start: int, end: int, digits: str, ok: bool
+    ) -> Finding | None:
+        if (0.9 if ok else 0.4) < self.min_confidence:
+            return None
+        # Luhn rejects most PAN-shaped noise; only winners pay for the
+        # brand lookup.
+        brand = guess_card_brand(digits) if ok else None
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=0.9 if ok else 0.4,
+            normalized=digits,
+            extras={"luhn_valid": ok, "brand": brand},
+        )
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding | None:
+        """Validate a candidate span and build a Finding, or reject it."""
+        raw = text[start:end]
+        digits = digits_only(raw)
+
+        # Quick reject obvious bad lengths
+        if not (13 <= len(digits) <= 19):
+            return None
+
+        return self._finding(raw, start, end, digits, luhn_ok(digits))
 
 try:
     import phonenumbers  # type: ignore
@@ -92,22 +238,34 @@ except Exception:  # pragma: no cover
     phonenumbers = None
 
 # --------------------------------------------------------------------
-# Simple phone regex fallback
-RE_PHONE = re.compile(
-    r"""
-    (?:\+\d{1,3}[\s-]?)?      # optional country code
-    (?:\(?\d{2,4}\)?[\s-]?)?  # optional area code
-    \d{3,4}[\s-]?\d{3,4}      # subscriber number
-    """,
-    re.VERBOSE,
+# Simple phone regex fallback: optional country code, optional area
+# code, then the subscriber number. Written single-line and flag-free
+# so _compile can hand it to the linear engines.
+RE_PHONE = _compile(
+    r"(?:\+\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}"
 )
 
 class PhoneDetector:
     """Detect phone numbers via regex + optional libphonenumber."""
     name = "phone"
+    requires_digits = True
 
-    def __init__(self, default_region: str = "GB") -> None:
+    def __init__(self, default_region: str = "GB", include_extras: bool = True) -> None:
         self.default_region = default_region
+        # Region and number-type lookups exist only to populate extras;
+        # callers that never read them can turn the work off wholesale.
+        self.include_extras = include_extras
+        # Region/type memo keyed by the parsed number's identity —
+        # scans see the same numbers (and country) over and over.
+        self._meta_cache: dict[tuple[int, int], tuple[str, str]] = {}
+        if phonenumbers is not None:
+            # Warm libphonenumber's lazy per-region metadata load here,
+            # at construction, instead of inside the first detect() call.
+            try:
+                from phonenumbers.phonemetadata import PhoneMetadata  # type: ignore
+                PhoneMetadata.metadata_for_region(default_region, None)
+            except Exception:  # pragma: no cover
+                pass
 
     def detect(self, text: str):
         if phonenumbers is not None:
@@ -118,10 +276,18 @@ class PhoneDetector:
                     num, phonenumbers.PhoneNumberFormat.E164
                 )
                 conf = 0.95 if phonenumbers.is_valid_number(num) else 0.6
-                extras = {
-                    "region": phonenumbers.region_code_for_number(num),
-                    "type": str(phonenumbers.number_type(num)),
-                }
+                if self.include_extras:
+                    key = (num.country_code, num.national_number)
+                    meta = self._meta_cache.get(key)
+                    if meta is None:
+                        meta = (
+                            phonenumbers.region_code_for_number(num),
+                            str(phonenumbers.number_type(num)),
+                        )
+                        self._meta_cache[key] = meta
+                    extras = {"region": meta[0], "type": meta[1]}
+                else:
+                    extras = None
                 yield Finding(
                     kind=self.name,
                     value=text[m.start : m.end],
@@ -144,37 +310,66 @@ class PhoneDetector:
             )
 
 
+@lru_cache(maxsize=32)
+def phone_detector_for(region: str) -> PhoneDetector:
+    """Shared PhoneDetector per region; detectors are stateless after init."""
+    return PhoneDetector(default_region=region)
+
+
 # --------------------------------------------------------------------
 # Detector stubs
 
+@lru_cache(maxsize=65536)
+def _validate_email(raw: str) -> tuple[str | None, str | None, str | None]:
+    """
+    Memoized email-validator call: (normalized, domain, error). Logs and
+    chat transcripts repeat the same addresses constantly, and the
+    validator dominates the cost of a hit; caching by raw value turns
+    repeats into a dict probe.
+    """
+    try:
+        result = validate_email(raw, allow_smtputf8=True)
+        return (result.normalized, result.domain, None)
+    except EmailNotValidError as e:
+        return (None, None, str(e))
+
+
 class EmailDetector:
     """Detect email addresses via regex + optional email-validator."""
     name = "email"
+    expression = _EMAIL_EXPR
+    # Cheap necessary condition checked by the registry prefilter.
+    triggers = ("@",)
 
     def detect(self, text: str) -> Iterable[Finding]:
         for m in RE_EMAIL.finditer(text):
-            raw = m.group("email")
-            start, end = m.span()
-            conf = 0.6
-            norm = raw
-            extras: Dict[str, Any] = {}
-            # If email-validator is available, upgrade confidence
-            if validate_email is not None:
-                try:
-                    result = validate_email(raw, allow_smtputf8=True)
-                    norm = result.normalized
-                    conf = 0.95
-                    extras["domain"] = result.domain
-                except EmailNotValidError as e:
-                    extras["invalid_reason"] = str(e)
-            yield Finding(
-                kind=self.name,
-                value=raw,
-                span=(start, end),
-                confidence=conf,
-                normalized=norm,
-                extras=extras,
-            )
+            yield self.finding_at(text, *m.span())
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding:
+        """Build a Finding for a candidate span, validating when possible."""
+        raw = text[start:end]
+        conf = 0.6
+        norm = raw
+        # Leave extras None when there is nothing to record so Finding
+        # reuses its shared empty mapping instead of allocating a dict.
+        extras: Dict[str, Any] | None = None
+        # If email-validator is available, upgrade confidence
+        if validate_email is not None:
+            normalized, domain, err = _validate_email(raw)
+            if normalized is not None:
+                norm = normalized
+                conf = 0.95
+                extras = {"domain": domain}
+            else:
+                extras = {"invalid_reason": err}
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=conf,
+            normalized=norm,
+            extras=extras,
+        )
 
 try:
     from stdnum import iban as std_iban  # type: ignore
@@ -185,122 +380,252 @@ except Exception:  # pragma: no cover
 
 # --------------------------------------------------------------------
 # Regex patterns
-RE_NHS = re.compile(r"\b(\d{3})[\s-]?(\d{3})[\s-]?(\d{4})\b")
-RE_SSN = re.compile(r"\b(\d{3})[\s-]?(\d{2})[\s-]?(\d{4})\b")
-RE_IBAN = re.compile(r"\b([A-Z]{2}\d{2}[A-Z0-9]{11,30})\b", re.IGNORECASE)
+RE_NHS = _compile(r"\b(\d{3})[\s-]?(\d{3})[\s-]?(\d{4})\b")
+RE_SSN = _compile(r"\b(\d{3})[\s-]?(\d{2})[\s-]?(\d{4})\b")
+# Case classes inlined in place of IGNORECASE so the pattern stays
+# flag-free and eligible for the linear engines.
+RE_IBAN = _compile(r"\b([A-Za-z]{2}\d{2}[A-Za-z0-9]{11,30})\b")
+# Bytes twin for ASCII inputs (see NumericPIIDetector._MERGED_B).
+RE_IBAN_B = re.compile(rb"\b([A-Za-z]{2}\d{2}[A-Za-z0-9]{11,30})\b")
+
+# Memoized stdnum checks: (valid, error). Keyed on the canonical value,
+# so the duplicated numbers typical of real corpora validate once.
+
+@lru_cache(maxsize=65536)
+def _std_nhs_valid(d: str) -> tuple[bool, str | None]:
+    try:
+        return (std_nhs.is_valid(d), None)
+    except Exception as e:
+        return (False, str(e))
+
+
+@lru_cache(maxsize=65536)
+def _std_ssn_valid(d: str) -> tuple[bool, str | None]:
+    try:
+        return (std_us_ssn.is_valid(d), None)
+    except Exception as e:
+        return (False, str(e))
+
+
+@lru_cache(maxsize=65536)
+def _std_iban_valid(canon: str) -> tuple[bool, str | None]:
+    try:
+        return (std_iban.is_valid(canon), None)
+    except Exception as e:
+        return (False, str(e))
+
+
+# Mod-11 weights for the nine NHS payload digits.
+_NHS_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# A=10 .. Z=35 IBAN letter expansion, applied by translate in one C pass.
+_IBAN_TRANS = str.maketrans(
+    {chr(c): str(c - 55) for c in range(ord("A"), ord("Z") + 1)}
+)
+
+
+def _iban_mod97_ok(canon: str) -> bool:
+    """ISO 13616 checksum in two C calls: translate then int() % 97."""
+    if not (canon[:2].isalpha() and canon[2:4].isdigit()):
+        return False
+    try:
+        return int((canon[4:] + canon[:4]).translate(_IBAN_TRANS)) % 97 == 1
+    except ValueError:  # non-alphanumeric slipped into a hand-fed span
+        return False
 
 # --------------------------------------------------------------------
 # NHS Number
 class NHSNumberDetector:
     """Detect UK NHS numbers via regex + mod-11 check."""
     name = "nhs_number"
+    requires_digits = True
+    expression = r"\b\d{3}[\s-]?\d{3}[\s-]?\d{4}\b"
+
+    def __init__(self, min_confidence: float = 0.0) -> None:
+        # See CreditCardDetector: gate before allocating the Finding.
+        self.min_confidence = min_confidence
 
     def detect(self, text: str):
         for m in RE_NHS.finditer(text):
-            raw = m.group(0)
-            d = digits_only(raw)
-            if len(d) != 10:
-                continue
-            valid = False
-            reason = None
-            if std_nhs is not None:
-                try:
-                    valid = std_nhs.is_valid(d)
-                except Exception as e:
-                    reason = str(e)
-            else:
-                # Mod 11 algorithm
-                weights = [10, 9, 8, 7, 6, 5, 4, 3, 2]
-                total = sum(int(d[i]) * weights[i] for i in range(9))
-                remainder = total % 11
-                check = 11 - remainder
-                if check == 11:
-                    check = 0
-                valid = (check != 10) and (check == int(d[9]))
-            conf = 0.92 if valid else 0.4
-            yield Finding(
-                kind=self.name,
-                value=raw,
-                span=m.span(),
-                confidence=conf,
-                normalized=d,
-                extras={"valid": valid, "reason": reason},
-            )
+            f = self.finding_at(text, *m.span())
+            if f is not None:
+                yield f
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding | None:
+        """Validate a candidate span and build a Finding, or reject it."""
+        raw = text[start:end]
+        d = digits_only(raw)
+        if len(d) != 10:
+            return None
+        valid = False
+        reason = None
+        if std_nhs is not None:
+            valid, reason = _std_nhs_valid(d)
+        else:
+            # Mod 11 algorithm; ord arithmetic avoids nine int() parses
+            # per candidate.
+            total = sum((ord(c) - 48) * w for c, w in zip(d, _NHS_WEIGHTS))
+            check = 11 - (total % 11)
+            if check == 11:
+                check = 0
+            valid = (check != 10) and (check == ord(d[9]) - 48)
+        conf = 0.92 if valid else 0.4
+        if conf < self.min_confidence:
+            return None
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=conf,
+            normalized=d,
+            extras={"valid": valid, "reason": reason},
+        )
 
 # --------------------------------------------------------------------
 # US Social Security Number
 class USSSNDetector:
     """Detect US Social Security Numbers via regex + range validation."""
     name = "ssn_us"
+    requires_digits = True
+    expression = r"\b\d{3}[\s-]?\d{2}[\s-]?\d{4}\b"
+
+    def __init__(self, min_confidence: float = 0.0) -> None:
+        # See CreditCardDetector: gate before allocating the Finding.
+        self.min_confidence = min_confidence
 
     def detect(self, text: str):
         for m in RE_SSN.finditer(text):
-            raw = m.group(0)
-            d = digits_only(raw)
-            if len(d) != 9:
-                continue
-            valid = None
-            reason = None
-            if std_us_ssn is not None:
-                try:
-                    valid = std_us_ssn.is_valid(d)
-                except Exception as e:
-                    valid = False
-                    reason = str(e)
+            f = self.finding_at(text, *m.span())
+            if f is not None:
+                yield f
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding | None:
+        """Validate a candidate span and build a Finding, or reject it."""
+        raw = text[start:end]
+        d = digits_only(raw)
+        if len(d) != 9:
+            return None
+        valid = None
+        reason = None
+        if std_us_ssn is not None:
+            valid, reason = _std_ssn_valid(d)
+        else:
+            # Basic exclusions
+            area, group, serial = d[:3], d[3:5], d[5:]
+            if area == "000" or area == "666" or "900" <= area <= "999":
+                valid = False
+            elif group == "00" or serial == "0000":
+                valid = False
             else:
-                # Basic exclusions
-                area, group, serial = d[:3], d[3:5], d[5:]
-                if area == "000" or area == "666" or "900" <= area <= "999":
-                    valid = False
-                elif group == "00" or serial == "0000":
-                    valid = False
-                else:
-                    valid = True
-            conf = 0.9 if valid else 0.4
-            yield Finding(
-                kind=self.name,
-                value=raw,
-                span=m.span(),
-                confidence=conf,
-                normalized=d,
-                extras={"valid": valid, "reason": reason},
-            )
+                valid = True
+        conf = 0.9 if valid else 0.4
+        if conf < self.min_confidence:
+            return None
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=conf,
+            normalized=d,
+            extras={"valid": valid, "reason": reason},
+        )
+
+# --------------------------------------------------------------------
+# Merged numeric family
+
+class NumericPIIDetector:
+    """
+    One pass for the digit-run family (PAN, NHS number, US SSN).
+
+    The three detectors above scan the whole text independently for
+    near-identical digit shapes; merging their prefilters into a single
+    alternation reads the text once and dispatches each hit to the
+    matching validator via the named group that fired. PAN comes first
+    so long runs are not claimed by the shorter shapes.
+    """
+    name = "numeric_pii"
+    # Kinds this detector can emit, for kind-filtered scans.
+    kinds = ("credit_card", "nhs_number", "ssn_us")
+    requires_digits = True
+
+    _MERGED = re.compile(
+        r"(?P<cc>\b(?:\d[ -]?){13,19}\b)"
+        r"|(?P<nhs>\b\d{3}[\s-]?\d{3}[\s-]?\d{4}\b)"
+        r"|(?P<ssn>\b\d{3}[\s-]?\d{2}[\s-]?\d{4}\b)"
+    )
+    # Bytes twin for ASCII inputs: the engine walks one byte per char
+    # and skips unicode digit classification, and byte offsets are
+    # identical to str offsets when the text is ASCII.
+    _MERGED_B = re.compile(_MERGED.pattern.encode("ascii"))
+
+    def __init__(self) -> None:
+        self._validators = {
+            "cc": CreditCardDetector().finding_at,
+            "nhs": NHSNumberDetector().finding_at,
+            "ssn": USSSNDetector().finding_at,
+        }
+
+    def detect(self, text: str) -> Iterable[Finding]:
+        if text.isascii():
+            pattern, subject = self._MERGED_B, text.encode("ascii")
+        else:
+            pattern, subject = self._MERGED, text
+        for m in pattern.finditer(subject):
+            f = self._validators[m.lastgroup](text, *m.span())
+            if f is not None:
+                yield f
+
 
 # --------------------------------------------------------------------
 # IBAN
 class IBANDetector:
     """Detect IBANs via regex + mod-97 validation."""
     name = "iban"
+    requires_digits = True
+    expression = r"\b[A-Za-z]{2}\d{2}[A-Za-z0-9]{11,30}\b"
+
+    def __init__(self, min_confidence: float = 0.0) -> None:
+        # See CreditCardDetector: gate before allocating the Finding.
+        self.min_confidence = min_confidence
 
     def detect(self, text: str):
+        if text.isascii():
+            for m in RE_IBAN_B.finditer(text.encode("ascii")):
+                f = self.finding_at(text, *m.span())
+                if f is not None:
+                    yield f
+            return
         for m in RE_IBAN.finditer(text):
-            raw = m.group(1)
-            canon = re.sub(r"\s+", "", raw).upper()
-            valid = None
-            reason = None
-            country = canon[:2]
-            if std_iban is not None:
-                try:
-                    valid = std_iban.is_valid(canon)
-                except Exception as e:
-                    valid = False
-                    reason = str(e)
+            f = self.finding_at(text, *m.span())
+            if f is not None:
+                yield f
+
+    def finding_at(self, text: str, start: int, end: int) -> Finding | None:
+        """Build a Finding for a candidate span, validating the checksum."""
+        raw = text[start:end]
+        # The prefilter admits no whitespace inside a candidate; plain
+        # replace covers hand-fed spans without a per-call re.sub.
+        canon = raw.replace(" ", "").upper()
+        valid = None
+        reason = None
+        country = canon[:2]
+        if std_iban is not None:
+            # Checksum first: failures (most IBAN-shaped noise) never
+            # reach the pure-Python library at all.
+            if _iban_mod97_ok(canon):
+                valid, reason = _std_iban_valid(canon)
             else:
-                # Minimal IBAN check: mod-97
-                def _mod97(s: str) -> int:
-                    rearr = s[4:] + s[:4]
-                    num = "".join(str(ord(c) - 55) if c.isalpha() else c for c in rearr)
-                    rem = 0
-                    for i in range(0, len(num), 9):
-                        rem = int(str(rem) + num[i:i+9]) % 97
-                    return rem
-                valid = country.isalpha() and canon[2:4].isdigit() and _mod97(canon) == 1
-            conf = 0.95 if valid else 0.5
-            yield Finding(
-                kind=self.name,
-                value=raw,
-                span=m.span(),
-                confidence=conf,
-                normalized=canon,
-                extras={"valid": valid, "country": country, "reason": reason},
-            )
\ No newline at end of file
+                valid = False
+        else:
+            valid = _iban_mod97_ok(canon)
+        conf = 0.95 if valid else 0.5
+        if conf < self.min_confidence:
+            return None
+        return Finding(
+            kind=self.name,
+            value=raw,
+            span=(start, end),
+            confidence=conf,
+            normalized=canon,
+            extras={"valid": valid, "country": country, "reason": reason},
+        )
\ No newline at end of file
@@ -8,22 +8,60 @@ Responsibilities:
 - Provide default() factory with built-in regex + entropy detectors.
 - Allow dynamic registration and unregistration.
 - Aggregate results from all detectors.
+
+When the optional `hyperscan` bindings are installed, regex-backed
+detectors (those exposing an `expression` pattern string and a
+`finding_at(text, start, end)` validator) are compiled into a single
+multi-pattern database and evaluated in one pass over the input instead
+of one full scan per detector. Detectors without an `expression` (e.g.
+the phonenumbers-backed PhoneDetector) keep their own scan pass.
 """
 
 from __future__ import annotations
-from typing import List, Optional
+import heapq
+import operator
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
 
 from .base import Detector, Finding
 from .regexes import (
     EmailDetector,
-    PhoneDetector,
-    CreditCardDetector,
-    NHSNumberDetector,
-    USSSNDetector,
     IBANDetector,
+    NumericPIIDetector,
+    _compile,
+    phone_detector_for,
 )
 from .entropy import HighEntropyTokenDetector
 
+try:
+    import hyperscan  # type: ignore
+except Exception:  # pragma: no cover
+    hyperscan = None
+
+# Shortest digit run any numeric detector's pattern can match (IBAN's
+# check digits); used as a shared prefilter probe.
+_RE_DIGIT_RUN = re.compile(r"\d{2}")
+
+# Findings sort by (start, end); span is exactly that tuple.
+_SPAN_KEY = operator.attrgetter("span")
+
+
+@lru_cache(maxsize=8)
+def _default_detectors(region: str) -> tuple[Detector, ...]:
+    """Build (once per region) the built-in detector set."""
+    return (
+        EmailDetector(),
+        phone_detector_for(region),
+        # One merged pass for credit_card / nhs_number / ssn_us instead
+        # of three near-identical digit scans.
+        NumericPIIDetector(),
+        IBANDetector(),
+        HighEntropyTokenDetector(),
+    )
+
 class DetectorRegistry:
     """
     Registry of detectors. Provides a unified scan() method
@@ -32,46 +70,377 @@ class DetectorRegistry:
 
     def __init__(self, detectors: Optional[List[Detector]] = None) -> None:
         self.detectors: List[Detector] = detectors or []
+        self._db = None
+        self._db_detectors: List[Detector] = []
+        self._steps: Optional[List[tuple]] = None
+        # Failure bookkeeping: every raise still reports an error
+        # marker, but a detector is only quarantined (skipped on later
+        # scans) after several failures — one exotic document tripping
+        # an input-dependent bug must not silently disable detection
+        # for the registry's remaining lifetime.
+        self._failures: dict[str, int] = {}
+        self._disabled: set[str] = set()
 
     @classmethod
     def default(cls, region: str = "GB") -> DetectorRegistry:
         """
         Return a registry preloaded with all built-in detectors.
         Region argument affects phone detection.
+
+        Detector instances are stateless, so they are built once per
+        region and shared between registries; each registry still owns
+        its own (mutable) detector list.
         """
-        return cls([
-            EmailDetector(),
-            PhoneDetector(default_region=region),
-            CreditCardDetector(),
-            NHSNumberDetector(),
-            USSSNDetector(),
-            IBANDetector(),
-            HighEntropyTokenDetector(),
-        ])
+        return cls(list(_default_detectors(region)))
 
     def register(self, detector: Detector) -> None:
         """Add a detector to the registry."""
         self.detectors.append(detector)
+        self._db = None  # invalidate compiled database
+        self._steps = None
+        # A replacement under a quarantined name gets a fresh chance.
+        self._failures.pop(getattr(detector, "name", ""), None)
+        self._disabled.discard(getattr(detector, "name", ""))
 
     def unregister(self, name: str) -> None:
         """Remove detectors by name."""
         self.detectors = [d for d in self.detectors if getattr(d, "name", "") != name]
+        self._db = None
+        self._steps = None
+
+    # ----------------------------------------------------------------
+    # Specialized per-detector steps
+
+    def _build_steps(self) -> None:
+        """
+        Flatten each detector into a prebound (detector, finditer,
+        handler) step so the hot loop in scan() does no attribute
+        lookups and, for pattern-backed detectors, no generator
+        plumbing: one C-level finditer call plus the validator.
+        Built once per detector set and reused across scans.
+        """
+        steps: List[tuple] = []
+        for d in self.detectors:
+            expr = getattr(d, "expression", None)
+            if expr and hasattr(d, "finding_at"):
+                # _compile, not re.compile: keeps the engine selection
+                # (re2 / PCRE2-JIT when installed) the detectors
+                # themselves get, instead of silently pinning the hot
+                # loop to the stdlib backtracker.
+                steps.append((d, _compile(expr).finditer, d.finding_at))
+            else:
+                steps.append((d, None, d.detect))
+        self._steps = steps
+
+    # Consecutive failures before a detector is quarantined.
+    _QUARANTINE_AFTER = 3
+
+    def _record_failure(self, d: Detector) -> None:
+        name = getattr(d, "name", "")
+        count = self._failures.get(name, 0) + 1
+        self._failures[name] = count
+        if count >= self._QUARANTINE_AFTER:
+            self._disabled.add(name)
+
+    # ----------------------------------------------------------------
+    # Cheap prefilters
+
+    def _runnable_detectors(
+        self, text: str, kinds: frozenset[str] | None = None
+    ) -> List[Detector]:
+        """
+        Drop detectors whose trigger conditions cannot occur in this
+        text before paying for their full regex pass. Substring checks
+        compile down to memmem; the shared digit-run probe runs at most
+        once per scan. When `kinds` is given, detectors producing other
+        kinds are skipped entirely.
+        """
+        has_digit_run: bool | None = None
+        out: List[Detector] = []
+        for d in self.detectors:
+            if self._disabled and getattr(d, "name", "") in self._disabled:
+                continue
+            if kinds is not None:
+                produced = getattr(d, "kinds", None) or (getattr(d, "name", ""),)
+                if kinds.isdisjoint(produced):
+                    continue
+            triggers = getattr(d, "triggers", None)
+            if triggers and not any(t in text for t in triggers):
+                continue
+            if getattr(d, "requires_digits", False):
+                if has_digit_run is None:
+                    has_digit_run = _RE_DIGIT_RUN.search(text) is not None
+                if not has_digit_run:
+                    continue
+            if len(text) < getattr(d, "min_input_len", 0):
+                continue
+            out.append(d)
+        return out
+
+    # ----------------------------------------------------------------
+    # Multi-pattern fast path
+
+    # Compiled databases shared across registries: every
+    # DetectorRegistry.default() in a process has the same expression
+    # set, and Hyperscan compilation is the expensive step. Values are
+    # (database-or-False, indices of the candidates it covers).
+    _DB_CACHE: dict[tuple[str, ...], tuple[object, tuple[int, ...]]] = {}
+
+    # Detector names whose expressions are known not to compile under
+    # Hyperscan (backreferences, lookbehind, ...). They skip the compile
+    # probe and go straight to the re path, so adding one never costs a
+    # doomed compilation attempt at startup. email's bounded-repeat
+    # alternation exceeds the pattern-size limit under SOM_LEFTMOST.
+    _HS_KNOWN_INCOMPATIBLE: frozenset[str] = frozenset({"email"})
+
+    @staticmethod
+    def _hs_compiles(expression: str) -> bool:
+        """Probe-compile one expression alone under the scan flags."""
+        try:
+            probe = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            probe.compile(
+                expressions=[expression.encode("utf-8")],
+                ids=[0],
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+            )
+            return True
+        except Exception:
+            return False
+
+    def _build_database(self) -> None:
+        """Compile the pattern-exposing detectors into one Hyperscan DB."""
+        candidates = [
+            d for d in self.detectors
+            if getattr(d, "expression", None)
+            and hasattr(d, "finding_at")
+            and getattr(d, "name", "") not in self._HS_KNOWN_INCOMPATIBLE
+        ]
+        if hyperscan is None or not candidates:
+            self._db = False  # nothing to compile; remember that
+            self._db_detectors = []
+            return
+        key = tuple(d.expression for d in candidates)
+        cached = self._DB_CACHE.get(key)
+        if cached is not None:
+            self._db, compatible = cached
+            self._db_detectors = [candidates[i] for i in compatible]
+            return
+        # Multi-pattern compile is all-or-nothing: one rejected
+        # expression (too large, unsupported construct) would throw away
+        # the fast path for every detector. Probe each pattern alone
+        # first and build the database over the survivors; the rejects
+        # keep their per-detector re pass.
+        compatible = tuple(
+            i for i, d in enumerate(candidates) if self._hs_compiles(d.expression)
+        )
+        self._db_detectors = [candidates[i] for i in compatible]
+        if not self._db_detectors:
+            self._db = False
+            self._DB_CACHE[key] = (False, compatible)
+            return
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[d.expression.encode("utf-8") for d in self._db_detectors],
+                ids=list(range(len(self._db_detectors))),
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self._db_detectors),
+            )
+            self._db = db
+        except Exception:  # combined compile failed -> plain re path
+            self._db = False
+        self._DB_CACHE[key] = (self._db, compatible)
+
+    def _scan_combined(
+        self, text: str, kinds: frozenset[str] | None = None
+    ) -> List[Finding]:
+        """One pass over the text for all compiled patterns."""
+        hits: List[tuple[int, int, int]] = []
+
+        def on_match(pat_id: int, start: int, end: int, flags: int, ctx=None) -> None:
+            hits.append((pat_id, start, end))
+
+        self._db.scan(text.encode("utf-8"), match_event_handler=on_match)
+        # Hyperscan reports every match, not just the leftmost-longest:
+        # an unbounded pattern over a 30-char token fires once per
+        # qualifying end offset. Keep only the longest span per
+        # (pattern, start) so the validator sees whole candidates —
+        # a prefix hit would validate and leave the tail unredacted.
+        best: dict[tuple[int, int], int] = {}
+        for pat_id, start, end in hits:
+            key = (pat_id, start)
+            if end > best.get(key, -1):
+                best[key] = end
+        findings: List[Finding] = []
+        for (pat_id, start), end in best.items():
+            d = self._db_detectors[pat_id]
+            if kinds is not None:
+                produced = getattr(d, "kinds", None) or (getattr(d, "name", ""),)
+                if kinds.isdisjoint(produced):
+                    continue
+            f = d.finding_at(text, start, end)
+            if f is not None:
+                findings.append(f)
+        return findings
+
+    # One executor shared by every registry in the process: batch
+    # pipelines call scan() per document, and respawning threads per
+    # call would swamp the fan-out win on small inputs.
+    _POOL: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def _pool(cls) -> ThreadPoolExecutor:
+        if cls._POOL is None:
+            cls._POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        return cls._POOL
+
+    def scan_parallel(
+        self, text: str, kinds: frozenset[str] | None = None
+    ) -> List[Finding]:
+        """
+        Run every detector over the same text concurrently on a shared
+        thread pool. Detector state is read-only and the bulk of each
+        pass is C-level regex scanning, so threads overlap usefully
+        (fully so on free-threaded builds). Results match scan().
+        """
+        def _one(d: Detector) -> List[Finding]:
+            try:
+                return list(d.detect(text))
+            except Exception as e:  # fail-safe, mirrors scan()
+                self._record_failure(d)
+                return [Finding(
+                    kind="error",
+                    value=getattr(d, "name", "unknown"),
+                    span=(0, 0),
+                    confidence=0.0,
+                    extras={"error": str(e)},
+                )]
+
+        runnable = self._runnable_detectors(text, kinds)
+        # Each detector's output is already position-sorted (finditer
+        # order); a K-way merge beats re-sorting the concatenation.
+        batches = list(self._pool().map(_one, runnable))
+        return list(heapq.merge(*batches, key=_SPAN_KEY))
 
-    def scan(self, text: str) -> List[Finding]:
+    def scan_stream(
+        self,
+        chunks: Iterable[str],
+        overlap: int = 128,
+        kinds: frozenset[str] | None = None,
+    ) -> Iterator[Finding]:
+        """
+        Scan an incrementally-supplied text without materializing it.
+
+        Maintains a rolling buffer: each incoming chunk is scanned along
+        with the previous buffer's tail, and only findings starting
+        before that tail (the "core") are emitted — anything starting
+        inside the last `overlap` characters may still grow, so it waits
+        for the next chunk. Spans are reported in whole-stream
+        coordinates. Complete for matches up to `overlap` characters
+        long, matching scan() on the concatenated input.
+        """
+        buf = ""
+        base = 0  # absolute offset of buf[0] in the stream
+        watermark = 0  # findings starting before this were already emitted
+        for chunk in chunks:
+            buf += chunk
+            core_end = len(buf) - overlap
+            if core_end <= 0:
+                continue
+            findings = self.scan(buf, kinds)
+            spans = [f.span for f in findings]  # buffer coordinates
+            for f in findings:
+                s, e = f.span
+                if s + base >= watermark and s < core_end:
+                    f.span = (s + base, e + base)
+                    yield f
+            watermark = base + core_end
+            # Trim up to the core boundary, but never through a reported
+            # finding: cutting mid-match would leave a suffix that
+            # re-matches as a bogus shorter hit in the next window. A
+            # straddler stays buffered whole; the watermark stops it
+            # from being emitted twice.
+            cut = core_end
+            for s, e in reversed(spans):
+                if s < cut < e:
+                    cut = s
+            base += cut
+            buf = buf[cut:]
+        if buf:
+            for f in self.scan(buf, kinds):
+                s, e = f.span
+                if s + base >= watermark:
+                    f.span = (s + base, e + base)
+                    yield f
+
+    # Inputs below this size are not worth the thread fan-out.
+    _PARALLEL_THRESHOLD = 1 << 20
+
+    def scan(self, text: str, kinds: frozenset[str] | None = None) -> List[Finding]:
         """
         Run all detectors against a text string.
         Returns a list of Finding objects, sorted by start offset.
+
+        `kinds`, when given, restricts the scan to detectors producing
+        those kinds — callers that already know which kinds they will
+        act on (e.g. from a policy's rules) skip the other passes.
         """
-        findings: List[Finding] = []
-        for d in self.detectors:
+        if self._db is None:
+            self._build_database()
+
+        if (
+            self._db is False
+            and len(text) >= self._PARALLEL_THRESHOLD
+            and (os.cpu_count() or 1) > 2
+            and len(self.detectors) > 1
+        ):
+            return self.scan_parallel(text, kinds)
+
+        # One position-sorted batch per source; the tail K-way merge is
+        # O(N log K) and skips the full re-sort — each detector's
+        # finditer already yields in start order.
+        batches: List[List[Finding]] = []
+        # Hyperscan reports byte offsets; only safe for str spans when ASCII.
+        use_db = self._db is not False and self._db is not None and text.isascii()
+        if use_db:
+            try:
+                batches.append(sorted(self._scan_combined(text, kinds), key=_SPAN_KEY))
+            except Exception:
+                use_db = False  # fall back to the per-detector loop
+                batches.clear()
+
+        if self._steps is None:
+            self._build_steps()
+
+        runnable = self._runnable_detectors(text, kinds)
+        for d, finditer, handler in self._steps:
+            if d not in runnable:
+                continue
+            if use_db and d in self._db_detectors:
+                continue
+            batch: List[Finding] = []
+            append = batch.append
             try:
-                findings.extend(d.detect(text))
+                if finditer is None:
+                    batch.extend(handler(text))
+                else:
+                    for m in finditer(text):
+                        f = handler(text, *m.span())
+                        if f is not None:
+                            append(f)
             except Exception as e:  # fail-safe
-                findings.append(Finding(
+                self._record_failure(d)
+                append(Finding(
                     kind="error",
                     value=getattr(d, "name", "unknown"),
                     span=(0, 0),
                     confidence=0.0,
                     extras={"error": str(e)},
                 ))
-        return sorted(findings, key=lambda f: (f.span[0], f.span[1]))
+                batch.sort(key=_SPAN_KEY)  # the (0, 0) marker lands mid-batch
+            if batch:
+                batches.append(batch)
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return batches[0]
+        return list(heapq.merge(*batches, key=_SPAN_KEY))
@@ -1,3 +1,5 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from .base import Match, all_detectors
 
@@ -5,11 +7,249 @@ from .base import Match, all_detectors
 # (pytest imports run_all directly in tests)
 from . import email, credit_card, iban, nhs, ssn, phone, entropy, schema_hints  # noqa: F401
 
+try:
+    import hyperscan  # type: ignore
+except Exception:  # pragma: no cover
+    hyperscan = None
+
+# Coarse, lookaround-free versions of each detector's prefilter regex.
+# A detector whose coarse pattern never fires cannot produce a match,
+# so one combined pass over the text decides which full passes to run.
+_PREFILTERS: dict[str, str] = {
+    "email": r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+\.[A-Za-z]{2,63}",
+    "credit_card": r"\d(?:[ -]?\d){12,18}",
+    "iban": r"[A-Za-z]{2}[0-9]{2}[A-Za-z0-9]{11,30}",
+    "nhs": r"\d(?:\s*\d){9}",
+    "ssn": r"\d{3}-?\d{2}-?\d{4}",
+    "phone": r"\+\d{9,15}|0[127]\d{8,10}",
+    "entropy": r"[A-Za-z0-9_=+/-]{20,}",
+}
+
+_DB = None  # hyperscan.Database once built, False when unavailable
+_DB_NAMES: list[str] = []
+
+
+def _build_db() -> None:
+    global _DB, _DB_NAMES
+    if hyperscan is None:
+        _DB = False
+        return
+    try:
+        _DB_NAMES = list(_PREFILTERS)
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[_PREFILTERS[n].encode("ascii") for n in _DB_NAMES],
+            ids=list(range(len(_DB_NAMES))),
+            # Presence is all we need; stop reporting a pattern after
+            # its first hit.
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_DB_NAMES),
+        )
+        _DB = db
+    except Exception:  # pragma: no cover - unsupported construct
+        _DB = False
+
+
+def _prefilter_hits(text: str) -> set[str] | None:
+    """
+    One Hyperscan pass; returns the prefiltered detector names that may
+    match, or None when the fast path is unavailable (no bindings, or
+    non-ASCII input where byte offsets diverge).
+    """
+    if _DB is None:
+        _build_db()
+    if _DB is False or not text.isascii():
+        return None
+    hit_ids: set[int] = set()
+
+    def on_match(pat_id: int, start: int, end: int, flags: int, ctx=None) -> None:
+        hit_ids.add(pat_id)
+
+    try:
+        _DB.scan(text.encode("ascii"), match_event_handler=on_match)
+    except Exception:  # pragma: no cover
+        return None
+    return {_DB_NAMES[i] for i in hit_ids}
+
+
+# Combined alternation over every detector exposing `pattern`/`patterns`
+# plus a `match_at` validator: one regex pass over the text instead of
+# one per detector, dispatching each hit by the named group that fired.
+# Branch order sets precedence when shapes overlap: specific validated
+# shapes first (credit_card claims long digit runs before nhs/ssn see
+# them), the broad entropy catch-all last.
+_BRANCH_ORDER = {
+    "email": 0,
+    "credit_card": 1,
+    "iban": 2,
+    "nhs": 3,
+    "ssn": 4,
+    "phone": 5,
+    "entropy": 9,
+}
+
+_COMBINED = None  # (compiled pattern, detector per group) or False
+_COMBINED_NAMES: frozenset[str] = frozenset()
+
+
+def _build_combined() -> None:
+    global _COMBINED, _COMBINED_NAMES
+    parts: list[str] = []
+    owners: list = []
+    ordered = sorted(
+        all_detectors(), key=lambda d: _BRANCH_ORDER.get(d.name, 8)
+    )
+    for det in ordered:
+        if not hasattr(det, "match_at"):
+            continue
+        pats = getattr(det, "patterns", None) or ()
+        single = getattr(det, "pattern", None)
+        if single:
+            pats = (*pats, single)
+        for p in pats:
+            parts.append(f"(?P<d{len(owners)}>{p})")
+            owners.append(det)
+    if not parts:
+        _COMBINED = False
+        return
+    try:
+        # Unique detectors in precedence order, for re-offering spans a
+        # higher-precedence validator rejected.
+        _COMBINED = (re.compile("|".join(parts)), owners, list(dict.fromkeys(owners)))
+        _COMBINED_NAMES = frozenset(d.name for d in owners)
+    except re.error:  # pragma: no cover - incompatible branch
+        _COMBINED = False
+
+
 def run_all(text: str, *, context: Optional[dict] = None) -> list[Match]:
+    # Empty payloads are routine in record pipelines and no pattern can
+    # match one — only context-driven (pattern-less) detectors run.
+    if not text:
+        if not context:
+            return []
+        matches = []
+        for det in all_detectors():
+            if hasattr(det, "match_at"):
+                continue
+            matches.extend(m for m in det.detect(text, context=context) if m is not None)
+        matches.sort(key=lambda m: (m.start, m.end))
+        return matches
+
+    if _COMBINED is None:
+        _build_combined()
+
     matches: list[Match] = []
-    for det in all_detectors():
+    active = _prefilter_hits(text)
+
+    if _COMBINED is not False:
+        combined, owners, ordered_dets = _COMBINED
+        for m in combined.finditer(text):
+            det = owners[int(m.lastgroup[1:])]
+            rank = _BRANCH_ORDER.get(det.name, 8)
+            res = None
+            if not (
+                active is not None
+                and det.name in _PREFILTERS
+                and det.name not in active
+            ):
+                res = det.match_at(text, m.start(), m.end(), context=context)
+            if res is None:
+                # The alternation consumed this span on the winning
+                # branch's behalf; a rejected candidate (an IBAN-shaped
+                # token failing its checksum, say) must still be offered
+                # to the lower-precedence validators whose own branch
+                # never got to fire here.
+                for other in ordered_dets:
+                    if _BRANCH_ORDER.get(other.name, 8) <= rank:
+                        continue
+                    if (
+                        active is not None
+                        and other.name in _PREFILTERS
+                        and other.name not in active
+                    ):
+                        continue
+                    res = other.match_at(text, m.start(), m.end(), context=context)
+                    if res is not None:
+                        break
+            if res is not None:
+                matches.append(res)
+
+    # Per-detector fallback passes (pattern-less detectors; everything
+    # when the combined compile failed). Validated checksum hits claim
+    # their spans so the entropy catch-all does not re-report the same
+    # bytes — the combined pass gives the same precedence for free.
+    claimed: list[tuple[int, int]] = []
+    for det in sorted(all_detectors(), key=lambda d: _BRANCH_ORDER.get(d.name, 8)):
+        if _COMBINED is not False and det.name in _COMBINED_NAMES:
+            continue
+        if active is not None and det.name in _PREFILTERS and det.name not in active:
+            continue
         for m in det.detect(text, context=context):
-            if m is not None:
-                matches.append(m)
+            if m is None:
+                continue
+            if det.name == "entropy" and any(
+                m.start < e and s < m.end for s, e in claimed
+            ):
+                continue
+            matches.append(m)
+            if det.name in ("credit_card", "iban", "nhs"):
+                claimed.append((m.start, m.end))
+    matches.sort(key=lambda m: (m.start, m.end))
+    return matches
+
+
+# Longer than any realistic single match (IBANs top out at 34 chars,
+# tokens at ~100); chunks extend by this much so matches straddling a
+# cut are still seen whole by one side.
+_CHUNK_OVERLAP = 128
+
+
+def run_all_chunked(
+    text: str,
+    *,
+    context: Optional[dict] = None,
+    chunk_size: int = 1 << 20,
+    max_workers: Optional[int] = None,
+) -> list[Match]:
+    """
+    run_all over MB-scale texts, split at line boundaries and scanned
+    concurrently. Detectors are stateless and the bulk of each pass is
+    C-level regex scanning, so chunks overlap usefully across threads.
+    Each chunk only keeps matches starting inside its own range — the
+    overlap guarantees those are seen whole, while truncated candidates
+    at a view's edge belong to (and are found by) the neighboring
+    chunk. Results match run_all for matches up to the overlap length.
+    """
+    n = len(text)
+    if n <= chunk_size:
+        return run_all(text, context=context)
+
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    while start < n:
+        end = min(start + chunk_size, n)
+        if end < n:
+            nl = text.rfind("\n", start, end)
+            if nl > start:
+                end = nl + 1
+        bounds.append((start, end))
+        start = end
+
+    def _one(span: tuple[int, int]) -> list[Match]:
+        s, e = span
+        lo = max(0, s - _CHUNK_OVERLAP)
+        hi = min(n, e + _CHUNK_OVERLAP)
+        out = []
+        for m in run_all(text[lo:hi], context=context):
+            m.start += lo
+            m.end += lo
+            # Owned by this chunk only if it starts in the core range.
+            if s <= m.start < e:
+                out.append(m)
+        return out
+
+    matches: list[Match] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for batch in pool.map(_one, bounds):
+            matches.extend(batch)
     matches.sort(key=lambda m: (m.start, m.end))
-    return matches
\ No newline at end of file
+    return matches
@@ -1,5 +1,15 @@
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Iterator
+
 from .base import Match, register
 
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover
+    ahocorasick = None
+
 # This detector relies on context = {"schema": {"field_name": "value", ...}}
 # It emits matches for fields whose names are known sensitive hints.
 _HINTS = {
@@ -17,14 +27,117 @@ _HINTS = {
     "date_of_birth": "DATE_DOB",
 }
 
+# Canonical form: lowercase, runs of non-alphanumerics collapsed to "_",
+# so "Card-Number" and "card number" both become "card_number".
+_CANON = re.compile(r"[^a-z0-9]+")
+# Translate twin of _CANON for the (overwhelmingly common) ASCII case:
+# one C pass instead of a regex substitution. Runs collapse afterwards.
+_NONALNUM = str.maketrans(
+    {chr(c): "_" for c in range(256) if not chr(c).isalnum()}
+)
+
+
+def _canonical_name(field: str) -> str:
+    if field.isascii():
+        s = field.lower().translate(_NONALNUM)
+        while "__" in s:
+            s = s.replace("__", "_")
+        return s.strip("_")
+    return _CANON.sub("_", field.lower()).strip("_")
+
+# Single-pass matchers over every hint key at once, instead of probing
+# each (i, j) substring of the field name against the dict. With the
+# optional pyahocorasick bindings this is one automaton walk; the
+# fallback is one alternation search (longest keys first, so
+# "credit_card" wins over "cc" at the same position). Both require the
+# hit to be token-bounded: preceded/followed by "_" or the string edge.
+if ahocorasick is not None:
+    _AC = ahocorasick.Automaton()
+    for _k, _v in _HINTS.items():
+        _AC.add_word(_k, (len(_k), _v))
+    _AC.make_automaton()
+else:
+    _AC = None
+
+_HINT_RE = re.compile(
+    r"(?:(?<=_)|^)(?:"
+    + "|".join(sorted(map(re.escape, _HINTS), key=len, reverse=True))
+    + r")(?=_|$)"
+)
+
+
+@lru_cache(maxsize=4096)
+def _label_for_field(name: str) -> str | None:
+    """Map a raw field name to a hint label, or None when no key fits."""
+    canon = _canonical_name(name)
+    if not canon:
+        return None
+    if _AC is not None:
+        last = len(canon) - 1
+        for end, (klen, label) in _AC.iter(canon):
+            start = end - klen + 1
+            if (start == 0 or canon[start - 1] == "_") and (
+                end == last or canon[end + 1] == "_"
+            ):
+                return label
+        return None
+    m = _HINT_RE.search(canon)
+    return _HINTS[m.group(0)] if m else None
+
+
+# Wrapper keys whose values are containers of real fields, not fields
+# themselves (common envelope shapes in row payloads).
+_CONTAINER_KEYS = frozenset({"properties", "fields", "items", "columns", "children"})
+
+
+def _iter_schema_fields(schema: Any) -> Iterator[tuple[str, Any]]:
+    """
+    Yield (field_name, value) pairs from an arbitrarily nested schema.
+
+    Iterative explicit-stack walk: no recursion depth limit, one pass
+    per mapping, and lazy so callers that stop early pay nothing for
+    the rest of the tree. Container-key values descend without being
+    reported as fields in their own right.
+    """
+    stack: list[Any] = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            for k, v in node.items():
+                if k in _CONTAINER_KEYS:
+                    stack.append(v)
+                    continue
+                yield (str(k), v)
+                if isinstance(v, (Mapping, list, tuple)):
+                    stack.append(v)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+
 class SchemaHintDetector:
     name = "schema_hints"
     labels = tuple(set(_HINTS.values()))
 
     def detect(self, text: str, *, context=None):
-        # No-op for raw text. This detector is meant for structured rows.
-        # We still implement the signature; integrate at the DataFrame layer.
-        return
-        yield  # generator stub
+        # Raw text carries no field names; hints come from context:
+        # context = {"schema": {...}} with arbitrarily nested containers.
+        # Each field name takes one automaton walk (or one alternation
+        # search without the bindings), memoized across repeated names.
+        if not context:
+            return
+        schema = context.get("schema")
+        if not isinstance(schema, Mapping):
+            return
+        for name, _value in _iter_schema_fields(schema):
+            label = _label_for_field(name)
+            if label is not None:
+                yield Match(
+                    label=label,
+                    start=0,
+                    end=0,
+                    value=name,
+                    confidence=0.6,
+                    meta={"source": "schema", "field": name},
+                )
 
 register(SchemaHintDetector())
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import re
 from .base import Match, register
+from .utils import compile_linear, contains_digit
 
-_SSN = re.compile(r'(?<!\d)(\d{3}-?\d{2}-?\d{4})(?!\d)')
+_SSN_EXPR = r'(?<!\d)\d{3}-?\d{2}-?\d{4}(?!\d)'
+_SSN = compile_linear(_SSN_EXPR)
 
 def _valid_ssn(d: str) -> bool:
     d = d.replace('-', '')
@@ -15,11 +16,20 @@ def _valid_ssn(d: str) -> bool:
 class SSNDetector:
     name = "ssn"
     labels = ("SSN",)
+    pattern = _SSN_EXPR
 
     def detect(self, text: str, *, context=None):
+        if not contains_digit(text):
+            return
         for m in _SSN.finditer(text):
-            raw = m.group(1)
-            if _valid_ssn(raw):
-                yield Match("SSN", m.start(1), m.end(1), raw, 0.95)
+            res = self.match_at(text, *m.span())
+            if res is not None:
+                yield res
+
+    def match_at(self, text: str, start: int, end: int, *, context=None):
+        raw = text[start:end]
+        if _valid_ssn(raw):
+            return Match("SSN", start, end, raw, 0.95)
+        return None
 
 register(SSNDetector())
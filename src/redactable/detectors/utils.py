@@ -1,18 +1,88 @@
 import math
 import re
+import string
+from collections import Counter
 from typing import Iterable
 
+from .base import _fold_decimal_digits, digits_only
+
+try:
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None
+
+
+# Constructs re2 rejects by design. Its parse errors are reported on
+# stderr through absl logging *before* the Python-level exception, so a
+# doomed compile is loud even inside try/except — screen these out
+# instead of probing.
+_RE2_UNSUPPORTED = ("(?=", "(?!", "(?<")
+
+
+def _re2_supports(pattern: str) -> bool:
+    return not any(marker in pattern for marker in _RE2_UNSUPPORTED)
+
+
+class _ASCIIDispatchPattern:
+    """
+    `finditer` shim pairing an ASCII-only fast engine with its stdlib
+    twin. re2 (and PCRE2 without UCP) treat \\d/\\w/\\s/\\b as
+    ASCII-only, while str-mode `re` classes are Unicode-aware — so the
+    fast engine only sees text where the two agree, and anything
+    containing non-ASCII (Arabic-Indic digits, say) takes the twin.
+    """
+
+    __slots__ = ("_fast", "_wide")
+
+    def __init__(self, fast, wide) -> None:
+        self._fast = fast
+        self._wide = wide
+
+    def finditer(self, text: str):
+        return (self._fast if text.isascii() else self._wide).finditer(text)
+
+
+def compile_linear(pattern: str, flags: int = 0):
+    """
+    Compile a prefilter pattern with google-re2 when installed, falling
+    back to stdlib `re`. re2 runs in linear time with no backtracking
+    but its character classes are ASCII-only, so it is used for ASCII
+    inputs only; non-ASCII text and patterns re2 rejects (lookarounds,
+    etc.) keep the `re` engine, making results match plain `re` on
+    every input.
+    """
+    wide = re.compile(pattern, flags)
+    if re2 is not None and _re2_supports(pattern):
+        try:
+            return _ASCIIDispatchPattern(re2.compile(pattern, flags), wide)
+        except Exception:
+            pass
+    return wide
+
+
+# Cheap necessary-condition probe: one C-level scan that lets digit
+# detectors bail out before entering their full pattern on clean text.
+_DIGIT_PROBE = re.compile(r'\d')
+
+def contains_digit(s: str) -> bool:
+    return _DIGIT_PROBE.search(s) is not None
+
+
+# 2*d with the "subtract 9 above 9" fold pre-applied; indexing replaces
+# the double-and-adjust branch in the Luhn loop.
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
 def luhn_check(digits: str) -> bool:
-    s = 0
-    alt = False
-    for d in reversed(digits):
-        n = ord(d) - 48
-        if alt:
-            n *= 2
-            if n > 9:
-                n -= 9
-        s += n
-        alt = not alt
+    if not digits.isascii():
+        # str-mode \d matches non-ASCII decimal digits, which the table
+        # lookup below cannot index; fold them before the fast path.
+        digits = _fold_decimal_digits(digits)
+    # Slice-split the odd/even positions instead of flipping a flag per
+    # digit: two straight-line C-level reductions, no branches.
+    s = sum(map(ord, digits[-1::-2])) - 48 * ((len(digits) + 1) // 2)
+    dbl = _LUHN_DOUBLE
+    s += sum(dbl[ord(d) - 48] for d in digits[-2::-2])
     return s % 10 == 0
 
 # Basic IBAN check (ISO 13616)
@@ -21,37 +91,57 @@ _IBAN_LEN = {
     # Common ones; extend as needed
     "GB": 22, "DE": 22, "FR": 27, "ES": 24, "IT": 27, "NL": 18, "BE": 16, "CH": 21, "IE": 22, "PL": 28
 }
+# A=10 .. Z=35 expansion done by translate in one C pass.
+_IBAN_TRANS = str.maketrans({c: str(ord(c) - 55) for c in string.ascii_uppercase})
+
 def iban_check(iban: str) -> bool:
     iban = iban.replace(' ', '').upper()
     country = iban[:2]
     if not _IBAN_RE.match(iban): return False
     if country in _IBAN_LEN and len(iban) != _IBAN_LEN[country]: return False
     # move 4 chars to end, convert letters to numbers (A=10 ... Z=35)
-    rearranged = iban[4:] + iban[:4]
-    digits = ''.join(str(ord(c)-55) if c.isalpha() else c for c in rearranged)
-    # mod 97 == 1
-    remainder = 0
-    for ch in digits:
-        remainder = (remainder*10 + ord(ch)-48) % 97
-    return remainder == 1
+    digits = (iban[4:] + iban[:4]).translate(_IBAN_TRANS)
+    # mod 97 == 1; int() parses the whole (<=60 digit) number in C,
+    # beating the old per-character remainder loop.
+    return int(digits) % 97 == 1
 
 # UK NHS number check (Mod 11)
+_NHS_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
 def nhs_check(n: str) -> bool:
-    n = re.sub(r'\D+', '', n)
+    n = digits_only(n)
     if len(n) != 10: return False
-    weights = list(range(10, 1, -1))  # 10..2
-    total = sum(int(d)*w for d, w in zip(n[:9], weights))
+    total = sum((ord(d) - 48) * w for d, w in zip(n, _NHS_WEIGHTS))
     check = 11 - (total % 11)
     if check == 11: check = 0
     if check == 10: return False
-    return check == int(n[-1])
+    return check == ord(n[9]) - 48
 
 def shannon_entropy(s: str) -> float:
     if not s: return 0.0
-    from collections import Counter
+    # Counter is the single pass; one reciprocal replaces the two
+    # divisions per unique symbol.
+    inv = 1.0 / len(s)
+    return -sum((c * inv) * math.log2(c * inv) for c in Counter(s).values())
+
+
+def entropy_if_at_least(s: str, threshold: float) -> float | None:
+    """
+    One histogram pass that fuses the bound check and the exact score.
+    A string with k unique symbols has entropy <= log2(k), so low-variety
+    tokens (repeats, all-zero hex) are rejected before any per-symbol
+    log work. Returns the exact entropy when it meets `threshold`,
+    else None.
+    """
+    n = len(s)
+    if not n:
+        return None
     counts = Counter(s)
-    length = len(s)
-    return -sum((c/length) * math.log2(c/length) for c in counts.values())
+    if math.log2(len(counts)) < threshold:
+        return None
+    inv = 1.0 / n
+    h = -sum((c * inv) * math.log2(c * inv) for c in counts.values())
+    return h if h >= threshold else None
 
 _BASE64ISH = re.compile(r'^[A-Za-z0-9+/=_-]+$')
 _HEXISH    = re.compile(r'^[0-9a-fA-F]+$')
@@ -2,9 +2,43 @@ import gzip
 from typing import Iterable, Protocol, Dict, Any
 
 class Record:
-    def __init__(self, content: str, meta: Dict[str, Any] | None = None):
+    """
+    One unit of input text plus its provenance.
+
+    Slotted, with source/line stored as plain attributes: line-oriented
+    readers yield millions of these, and a per-record metadata dict was
+    the dominant allocation on that path. The legacy `meta` mapping is
+    still available but built lazily, only for callers that ask.
+    """
+
+    __slots__ = ("content", "source", "line", "_meta")
+
+    def __init__(
+        self,
+        content: str,
+        meta: Dict[str, Any] | None = None,
+        *,
+        source: str = "",
+        line: int = 0,
+    ):
         self.content = content
-        self.meta = meta or {}
+        self._meta = meta
+        if meta is not None:
+            self.source = meta.get("source", source)
+            self.line = meta.get("line", line)
+        else:
+            self.source = source
+            self.line = line
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        m = self._meta
+        if m is None:
+            m = {"source": self.source}
+            if self.line:
+                m["line"] = self.line
+            self._meta = m
+        return m
 
 class Reader(Protocol):
     def iter_records(self) -> Iterable[Record]: ...
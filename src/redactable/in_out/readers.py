@@ -1,12 +1,37 @@
 from .base import Record, Reader, _open
 
+# Block size for the line reader; large enough to amortize read() and
+# decode overhead, small enough to stay cache-resident.
+_BLOCK = 1 << 16
+
+
 class TextFileReader(Reader):
     def __init__(self, path: str, by_line: bool = True):
         self.path = path; self.by_line = by_line
     def iter_records(self):
+        if not self.by_line:
+            with _open(self.path, "rt") as f:
+                yield Record(f.read(), source=self.path)
+            return
+        # Read fixed blocks and split them ourselves instead of
+        # iterating the file object line by line: the newline never
+        # enters the line string (no per-line rstrip copy) and the
+        # split happens once per block in C.
         with _open(self.path, "rt") as f:
-            if self.by_line:
-                for i, line in enumerate(f, 1):
-                    yield Record(line.rstrip("\n"), {"source": self.path, "line": i})
-            else:
-                yield Record(f.read(), {"source": self.path})
\ No newline at end of file
+            read = f.read
+            source = self.path
+            tail = ""
+            i = 0
+            while True:
+                block = read(_BLOCK)
+                if not block:
+                    break
+                if tail:
+                    block = tail + block
+                lines = block.split("\n")
+                tail = lines.pop()
+                for line in lines:
+                    i += 1
+                    yield Record(line, source=source, line=i)
+            if tail:  # final line without a trailing newline
+                yield Record(tail, source=source, line=i + 1)
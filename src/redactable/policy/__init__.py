@@ -11,6 +11,16 @@ applies rules to detector findings.
 from .model import Policy, Rule
 from .loader import load_policy
 from .engine import apply_policy
+from .defaults import get_builtin_policy, is_builtin_policy
+from .builder import PolicyBuilder
 
 
-__all__ = ["Policy", "Rule", "load_policy", "apply_policy"]
\ No newline at end of file
+__all__ = [
+    "Policy",
+    "Rule",
+    "load_policy",
+    "apply_policy",
+    "get_builtin_policy",
+    "is_builtin_policy",
+    "PolicyBuilder",
+]
\ No newline at end of file
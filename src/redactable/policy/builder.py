@@ -0,0 +1,69 @@
+# ruff: noqa: E402
+"""
+Programmatic policy construction.
+
+PolicyBuilder is for callers that assemble policies in code (tests,
+embedding applications) rather than loading them from YAML/JSON.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from .model import Policy, Rule
+
+
+class PolicyBuilder:
+    """
+    Accumulates rules and materializes a Policy.
+
+    Every rule is validated once, on entry: Rule instances are already
+    validated and mappings go through the Rule constructor. build() can
+    therefore hand the list to Policy.model_construct and skip a second
+    full schema walk — factories that materialize the same policy many
+    times only pay validation when rules are added.
+    """
+
+    def __init__(self, name: str, version: int = 1, description: str | None = None):
+        if version < 1:
+            raise ValueError("Policy schema version must be >= 1")
+        self._name = name.strip()
+        self._version = version
+        self._description = description
+        self._rules: list[Rule] = []
+
+    def add(self, rule: Rule | dict[str, Any]) -> PolicyBuilder:
+        """Append a rule; mappings are validated into Rule here."""
+        if not isinstance(rule, Rule):
+            rule = Rule(**rule)
+        self._rules.append(rule)
+        return self
+
+    # Convenience wrappers for the three actions.
+
+    def redact(self, field: str, *, replacement: str | None = None) -> PolicyBuilder:
+        return self.add(Rule(
+            id=f"{field}_redact", field=field, action="redact",
+            replacement=replacement,
+        ))
+
+    def mask(
+        self, field: str, *, keep_head: int = 0, keep_tail: int = 4, glyph: str = "•"
+    ) -> PolicyBuilder:
+        return self.add(Rule(
+            id=f"{field}_mask", field=field, action="mask",
+            keep_head=keep_head, keep_tail=keep_tail, mask_glyph=glyph,
+        ))
+
+    def tokenize(self, field: str, *, salt: str = "") -> PolicyBuilder:
+        return self.add(Rule(
+            id=f"{field}_tokenize", field=field, action="tokenize", salt=salt,
+        ))
+
+    def build(self) -> Policy:
+        """Materialize the Policy without revalidating the rules."""
+        return Policy.model_construct(
+            version=self._version,
+            name=self._name,
+            description=self._description,
+            rules=list(self._rules),
+        )
@@ -0,0 +1,79 @@
+# ruff: noqa: E402
+"""
+Built-in policies.
+
+Ships a small set of ready-to-use policies so callers (CLI, tests,
+examples) can run without a policy file on disk. Lookups hand back a
+fresh Policy per call — callers may mutate their copy freely.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from .model import Policy, Rule
+
+
+def _make_builtins() -> dict[str, Policy]:
+    return {
+        "gdpr": Policy(
+            version=1,
+            name="gdpr",
+            description="GDPR-style defaults: pseudonymise identifiers, mask contact details.",
+            rules=[
+                Rule(id="email_tokenize", field="email", action="tokenize"),
+                Rule(id="phone_mask", field="phone", action="mask", keep_tail=4),
+                Rule(id="nhs_redact", field="nhs_number", action="redact"),
+                Rule(id="iban_redact", field="iban", action="redact"),
+            ],
+        ),
+        "pci": Policy(
+            version=1,
+            name="pci",
+            description="PCI-DSS-style defaults: never expose more than the last four PAN digits.",
+            rules=[
+                Rule(id="pan_mask", field="credit_card", action="mask", keep_tail=4),
+                Rule(id="iban_mask", field="iban", action="mask", keep_tail=4),
+            ],
+        ),
+    }
+
+
+_BUILTINS: dict[str, Policy] = _make_builtins()
+
+# Pre-serialized once at import: re-validating compact JSON through
+# pydantic-core is far cheaper than model_copy(deep=True), whose Python
+# deepcopy traversal would otherwise run on every lookup.
+_BUILTIN_SERIALIZED: dict[str, str] = {
+    key: policy.model_dump_json() for key, policy in _BUILTINS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _normalise_key(name: str) -> str:
+    """'GDPR', 'gdpr.yaml' and 'policies/gdpr.yml' all mean 'gdpr'."""
+    # Plain string ops: a PurePath here would pay flavor detection and
+    # several allocations just to read .name.
+    key = str(name).strip().rsplit("/", 1)[-1].rsplit("\\", 1)[-1].casefold()
+    if key.endswith((".yaml", ".yml", ".json")):
+        return key.rsplit(".", 1)[0]
+    return key
+
+
+def get_builtin_policy(name: str) -> Policy:
+    """Return a fresh copy of the named built-in policy."""
+    key = _normalise_key(name)
+    try:
+        raw = _BUILTIN_SERIALIZED[key]
+    except KeyError:
+        raise KeyError(f"Unknown built-in policy: {name!r}") from None
+    return Policy.model_validate_json(raw)
+
+
+def is_builtin_policy(name: str) -> bool:
+    """True when the name resolves to a built-in policy."""
+    # Membership only — no reason to materialize a policy copy here.
+    return _normalise_key(name) in _BUILTINS
+
+
+def builtin_policy_names() -> tuple[str, ...]:
+    return tuple(_BUILTINS)
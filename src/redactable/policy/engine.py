@@ -1,85 +1,175 @@
 # ruff: noqa: E402
-from dataclasses import dataclass
 import hashlib
-from typing import Iterable
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Iterable
 
 from redactable.detectors import Finding
-from redactable.policy import Policy
-
-
-@dataclass(slots=True)
-class _MaskCfg:
-    keep_head: int = 0
-    keep_tail: int = 4
-    glyph: str = "•"
+from redactable.policy import Policy, Rule
 
 # --- local transforms (minimal v0.1; no external deps) ---------------------
 
-def _redact(text: str, findings: Iterable[Finding], placeholder: str = "[REDACTED:{kind}]") -> str:
-    out = text
-    for f in sorted(findings, key=lambda x: x.span[0], reverse=True):
-        s, e = f.span
-        out = out[:s] + placeholder.format(kind=f.kind.upper()) + out[e:]
-    return out
+# Shared runs of each single-char glyph, grown on demand: slicing a
+# pooled run is one allocation, and the same rules mask the same glyph
+# over and over.
+_GLYPH_POOLS: dict[str, str] = {}
 
 
-def _mask_segment(s: str, cfg: _MaskCfg) -> str:
-    if len(s) <= cfg.keep_head + cfg.keep_tail:
-        return cfg.glyph * len(s)
-    mid = cfg.glyph * (len(s) - cfg.keep_head - cfg.keep_tail)
-    return s[:cfg.keep_head] + mid + s[-cfg.keep_tail:]
+def _glyph_run(glyph: str, n: int) -> str:
+    if len(glyph) != 1:
+        return glyph * n
+    pool = _GLYPH_POOLS.get(glyph, "")
+    if len(pool) < n:
+        pool = glyph * max(n, 256)
+        _GLYPH_POOLS[glyph] = pool
+    return pool[:n]
 
 
-def _mask(text: str, findings: Iterable[Finding], cfg: _MaskCfg) -> str:
-    out = text
-    for f in sorted(findings, key=lambda x: x.span[0], reverse=True):
-        s, e = f.span
-        out = out[:s] + _mask_segment(out[s:e], cfg) + out[e:]
-    return out
+@lru_cache(maxsize=256)
+def _mask_renderer(rule: Rule) -> Callable[[str], str]:
+    """
+    Specialized mask renderer for one rule (rules are frozen and
+    hashable, so renderers memoize across calls and policies). The
+    keep_head/keep_tail branches are taken once here instead of per
+    finding, and each closure reads head/tail/glyph from its cells —
+    no attribute lookups in the per-finding loop.
+    """
+    head, tail, glyph = rule.keep_head, rule.keep_tail, rule.mask_glyph
+    keep = head + tail
+    if not head and not tail:
+        def render(s: str) -> str:
+            return _glyph_run(glyph, len(s))
+    elif not head:
+        def render(s: str) -> str:
+            n = len(s)
+            if n <= keep:
+                return _glyph_run(glyph, n)
+            return _glyph_run(glyph, n - tail) + s[-tail:]
+    elif not tail:
+        def render(s: str) -> str:
+            n = len(s)
+            if n <= keep:
+                return _glyph_run(glyph, n)
+            return s[:head] + _glyph_run(glyph, n - head)
+    else:
+        def render(s: str) -> str:
+            n = len(s)
+            if n <= keep:
+                return _glyph_run(glyph, n)
+            return s[:head] + _glyph_run(glyph, n - keep) + s[-tail:]
+    return render
 
 
 def _sha256(value: str, salt: str = "") -> str:
     return hashlib.sha256((salt + value).encode("utf-8")).hexdigest()
 
 
-def _tokenize(text: str, findings: Iterable[Finding], salt: str = "") -> str:
-    out = text
-    for f in sorted(findings, key=lambda x: x.span[0], reverse=True):
-        s, e = f.span
-        token = _sha256(f.normalized or f.value, salt)
-        out = out[:s] + token + out[e:]
-    return out
+def _salted_sha256(salt: str):
+    """
+    Per-rule hasher: the salt block is absorbed once, and each value
+    hashes from a copy() of that state — no salt re-hash and no
+    salt+value concatenation per finding. Digests match _sha256.
+    """
+    base = hashlib.sha256(salt.encode("utf-8"))
+
+    def hexdigest(value: str) -> str:
+        h = base.copy()
+        h.update(value.encode("utf-8"))
+        return h.hexdigest()
+
+    return hexdigest
 
 
 # --- public API -------------------------------------------------------------
 
-def apply_policy(policy: Policy, findings: list[Finding], text: str) -> str:
+def apply_policy(policy: Policy, findings: Iterable[Finding], text: str) -> str:
     """
     Apply a Policy to text using previously-detected Findings.
 
     Strategy (v0.1):
     - Treat `rule.field` as the detector kind (e.g. "email", "credit_card").
-    - Apply actions independently; rules are idempotent by design.
-    - Apply replacements right-to-left to preserve spans.
+    - Collect every replacement as a (start, end, replacement) event in
+      original text coordinates, then build the output in one pass.
+    - Overlapping spans: the earliest-declared rule wins.
     """
-    out = text
+    if not policy.rules:
+        return text
 
-    # Group findings by kind for quick lookup
+    # Group findings by kind for quick lookup — only the kinds some
+    # rule actually targets; the rest would be grouped and then ignored.
+    by_field = policy.rules_by_field
+    wanted = by_field.keys()
     by_kind: dict[str, list[Finding]] = {}
     for f in findings:
-        by_kind.setdefault(f.kind, []).append(f)
-
-    for rule in policy.rules:
-        targets = by_kind.get(rule.field, [])
-        if not targets:
-            continue
+        if f.kind in wanted:
+            by_kind.setdefault(f.kind, []).append(f)
+    if not by_kind:
+        # Common case per record in log pipelines: nothing to do.
+        return text
+
+    events: list[tuple[int, int, str]] = []
+    for kind, targets in by_kind.items():
+        # A rule covers every finding of its kind, so a later rule on
+        # the same field can only produce events the overlap pass would
+        # discard — only the first declared rule per field runs. The
+        # index makes this loop O(kinds present), not O(rules).
+        rule = by_field[kind][0]
         if rule.action == "redact":
             placeholder = rule.replacement or "[REDACTED:{kind}]"
-            out = _redact(out, targets, placeholder)
+            # Every target shares the rule's kind (findings are grouped
+            # by it), so the placeholder renders once per rule rather
+            # than once per finding — and literal placeholders (the
+            # common custom-replacement case) skip format() entirely.
+            if "{kind}" in placeholder:
+                replacement = placeholder.format(kind=rule.field.upper())
+            else:
+                replacement = placeholder
+            for f in targets:
+                s, e = f.span
+                events.append((s, e, replacement))
         elif rule.action == "mask":
-            cfg = _MaskCfg(keep_head=rule.keep_head, keep_tail=rule.keep_tail, glyph=rule.mask_glyph)
-            out = _mask(out, targets, cfg)
+            render = _mask_renderer(rule)
+            for f in targets:
+                s, e = f.span
+                events.append((s, e, render(text[s:e])))
         elif rule.action == "tokenize":
-            out = _tokenize(out, targets, salt=rule.salt)
-
-    return out
+            digest = _salted_sha256(rule.salt)
+            # Real streams repeat values constantly (the same email on
+            # every line); hash each distinct value once per rule.
+            tokens: dict[str, str] = {}
+            for f in targets:
+                s, e = f.span
+                value = f.normalized or f.value
+                token = tokens.get(value)
+                if token is None:
+                    token = tokens[value] = digest(value)
+                events.append((s, e, token))
+
+    if not events:
+        return text
+
+    # Single left-to-right pass: O(len(text) + events) instead of one
+    # full-string copy per replacement. This is the only sort in the
+    # function; per-rule runs arrive in scan order, so timsort sees
+    # mostly-sorted input and finishes in near-linear time.
+    events.sort(key=itemgetter(0, 1))
+    return _apply_events(text, events)
+
+
+def _apply_events(text: str, events: list[tuple[int, int, str]]) -> str:
+    """
+    Render sorted (start, end, replacement) events over text. Isolated
+    so the walk runs on locals only — this is the engine's innermost
+    loop, all slicing and list appends.
+    """
+    parts: list[str] = []
+    append = parts.append
+    cursor = 0
+    for start, end, replacement in events:
+        if start < cursor:
+            continue  # overlaps a span an earlier rule already replaced
+        append(text[cursor:start])
+        append(replacement)
+        cursor = end
+    append(text[cursor:])
+    return "".join(parts)
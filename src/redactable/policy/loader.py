@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
@@ -9,8 +12,30 @@ from .model import Policy
 
 try:
     import yaml  # type: ignore
+    try:
+        # libyaml C extension: same output, ~10x faster parse
+        from yaml import CSafeLoader as _YamlLoader  # type: ignore
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader as _YamlLoader  # type: ignore
 except Exception:  # pragma: no cover
     yaml = None
+    _YamlLoader = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+@lru_cache(maxsize=256)
+def _norm_key(s: str) -> str:
+    """
+    Normalize a policy key (field, action, transform name). Policies
+    repeat the same handful of keys across every rule, so the cache
+    turns the strip+casefold chain into a dict hit; interning makes
+    downstream dict lookups compare by identity first.
+    """
+    return sys.intern(s.strip().casefold())
 
 
 _RULE_ALLOWED_KEYS = {
@@ -29,15 +54,19 @@ def _extract_field(rule: Mapping[str, Any]) -> str | None:
     """Infer the rule field from extended policy formats."""
 
     value = rule.get("field")
-    if isinstance(value, str) and value.strip():
-        return value.strip().lower()
+    if isinstance(value, str):
+        field = _norm_key(value)
+        if field:
+            return field
 
     when = rule.get("when")
     if isinstance(when, Mapping):
         for key in ("detector", "field", "kind"):
             candidate = when.get(key)
-            if isinstance(candidate, str) and candidate.strip():
-                return candidate.strip().lower()
+            if isinstance(candidate, str):
+                field = _norm_key(candidate)
+                if field:
+                    return field
 
     return None
 
@@ -45,7 +74,7 @@ def _extract_field(rule: Mapping[str, Any]) -> str | None:
 def _guess_action_from_type(t: str | None) -> str | None:
     if not t:
         return None
-    key = t.strip().lower()
+    key = _norm_key(t)
     mapping = {
         "mask": "mask",
         "mask_pan": "mask",
@@ -62,24 +91,31 @@ def _guess_action_from_type(t: str | None) -> str | None:
     return mapping.get(key)
 
 
+# No recognized prefix is a prefix of another, so a slice-and-lookup
+# per distinct prefix length replaces ten startswith calls.
+_PREFIX_ACTIONS = {
+    "mask": "mask",
+    "tokenise": "tokenize",
+    "tokenize": "tokenize",
+    "pseudonymise": "tokenize",
+    "pseudonymize": "tokenize",
+    "hash": "tokenize",
+    "redact": "redact",
+    "scrub": "redact",
+    "generalise": "mask",
+    "generalize": "mask",
+}
+_PREFIX_LENS = tuple(sorted({len(k) for k in _PREFIX_ACTIONS}, reverse=True))
+
+
 def _guess_action_from_name(name: str | None) -> str | None:
     if not name:
         return None
-    key = name.strip().lower()
-    prefixes = (
-        ("mask", "mask"),
-        ("tokenise", "tokenize"),
-        ("tokenize", "tokenize"),
-        ("pseudonymise", "tokenize"),
-        ("pseudonymize", "tokenize"),
-        ("hash", "tokenize"),
-        ("redact", "redact"),
-        ("scrub", "redact"),
-        ("generalise", "mask"),
-        ("generalize", "mask"),
-    )
-    for prefix, action in prefixes:
-        if key.startswith(prefix):
+    key = _norm_key(name)
+    lookup = _PREFIX_ACTIONS.get
+    for length in _PREFIX_LENS:
+        action = lookup(key[:length])
+        if action is not None:
             return action
     return None
 
@@ -189,6 +225,11 @@ def _prepare_rules(
     return rules
 
 
+def _stripped(value: Any) -> str:
+    """Strip a maybe-string exactly once; non-strings read as empty."""
+    return value.strip() if isinstance(value, str) else ""
+
+
 def _normalize_policy_payload(data: Any, source: Path) -> dict[str, Any]:
     if not isinstance(data, Mapping):
         raise ValueError("Policy documents must define a mapping at the top level")
@@ -198,38 +239,37 @@ def _normalize_policy_payload(data: Any, source: Path) -> dict[str, Any]:
     description: str | None = None
     if isinstance(metadata, Mapping):
         for key in ("name", "id", "title"):
-            value = metadata.get(key)
-            if isinstance(value, str) and value.strip():
-                name = value.strip()
+            candidate = _stripped(metadata.get(key))
+            if candidate:
+                name = candidate
                 break
-        meta_desc = metadata.get("description")
-        if isinstance(meta_desc, str) and meta_desc.strip():
-            description = meta_desc.strip()
+        meta_desc = _stripped(metadata.get("description"))
+        if meta_desc:
+            description = meta_desc
 
-    if isinstance(data.get("name"), str) and data.get("name").strip():
-        name = data["name"].strip()
+    top_name = _stripped(data.get("name"))
+    if top_name:
+        name = top_name
 
     if name is None:
         name = source.stem
 
-    if isinstance(data.get("description"), str) and data.get("description").strip():
-        description = data["description"].strip()
+    top_desc = _stripped(data.get("description"))
+    if top_desc:
+        description = top_desc
 
     defaults = data.get("defaults")
     default_action: str | None = None
     if isinstance(defaults, Mapping):
-        default_value = defaults.get("action")
-        if isinstance(default_value, str) and default_value.strip():
-            default_action = default_value.strip()
+        default_action = _stripped(defaults.get("action")) or None
 
     raw_transforms = data.get("transforms")
     transform_types: dict[str, Any] = {}
     if isinstance(raw_transforms, Mapping):
         for key, value in raw_transforms.items():
-            if isinstance(value, Mapping):
-                transform_types[key] = dict(value)
-            else:
-                transform_types[key] = {"type": value}
+            # Stored as-is: the loader only reads from these, so the
+            # defensive per-transform dict copy bought nothing.
+            transform_types[key] = value if isinstance(value, Mapping) else {"type": value}
 
     rules = _prepare_rules(
         data,
@@ -246,54 +286,91 @@ def _normalize_policy_payload(data: Any, source: Path) -> dict[str, Any]:
     return payload
 
 
-def _candidate_paths(path: Path) -> Iterable[Path]:
-    seen: set[Path] = set()
+# Repo root relative to this file (src/redactable/policy/loader.py).
+_PACKAGE_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
 
-    def emit(candidate: Path) -> Iterable[Path]:
-        resolved = candidate.resolve(strict=False)
-        if resolved in seen:
+def _candidate_paths(path: str) -> Iterable[str]:
+    # Plain string joins deduped by the joined string: resolve() walks
+    # every path component with lstat, and we only need to avoid probing
+    # the same candidate twice.
+    seen: set[str] = set()
+
+    def emit(candidate: str) -> Iterable[str]:
+        if candidate in seen:
             return
-        seen.add(resolved)
+        seen.add(candidate)
         yield candidate
 
     yield from emit(path)
 
-    if path.is_absolute():
+    if os.path.isabs(path):
         return
 
-    package_root = Path(__file__).resolve().parents[3]
-    roots = [Path.cwd(), package_root, package_root / "src"]
+    join = os.path.join
+    roots = [os.getcwd(), _PACKAGE_ROOT, join(_PACKAGE_ROOT, "src")]
     relative_names = [path]
-    if path.parent in {Path("."), Path()}:  # simple filename
+    if os.path.dirname(path) in ("", "."):  # simple filename
+        name = os.path.basename(path)
         relative_names.extend(
             [
-                Path("src") / "examples" / "policies" / path.name,
-                Path("examples") / "policies" / path.name,
-                Path("policies") / path.name,
+                join("src", "examples", "policies", name),
+                join("examples", "policies", name),
+                join("policies", name),
             ]
         )
 
     for root in roots:
         for rel in relative_names:
-            yield from emit(root / rel)
+            yield from emit(join(root, rel))
 
 
 def _resolve_policy_path(raw: str | Path) -> Path:
-    requested = Path(raw)
+    requested = str(raw)
     for candidate in _candidate_paths(requested):
-        if candidate.exists():
-            return candidate
-    return requested
+        if os.path.isfile(candidate):  # policies must be files
+            return Path(candidate)
+    return Path(requested)
+
+
+# Parsed policies keyed by absolute path; a (mtime_ns, size) pair
+# invalidates the entry on edit, repeated loads of an unchanged file
+# skip disk + parse + validate.
+_POLICY_CACHE: dict[str, tuple[int, int, Policy]] = {}
 
 
 def load_policy(path: str | Path) -> Policy:
     """Load a YAML or JSON policy file into a Policy object."""
 
     p = _resolve_policy_path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"Policy file not found: {p}")
-
-    text = p.read_text(encoding="utf-8")
+    try:
+        st = p.stat()
+    except OSError:
+        raise FileNotFoundError(f"Policy file not found: {p}") from None
+
+    # JSON fast path: a pre-compiled .json sibling (see compile.py) that
+    # is at least as new as its YAML source parses ~100x faster, so
+    # prefer it in the steady state.
+    if p.suffix.lower() in {".yaml", ".yml"}:
+        sibling = p.with_suffix(".json")
+        try:
+            sib_st = sibling.stat()
+        except OSError:
+            sib_st = None
+        if sib_st is not None and sib_st.st_mtime_ns >= st.st_mtime_ns:
+            p, st = sibling, sib_st
+
+    cache_key = str(p.resolve(strict=False))
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _POLICY_CACHE.get(cache_key)
+    if cached is not None and (cached[0], cached[1]) == stamp:
+        return cached[2]
+
+    # Both parsers accept bytes and decode UTF-8 internally (in C for
+    # CSafeLoader/orjson), so decoding to str first is pure overhead.
+    raw_bytes = p.read_bytes()
     suffix = p.suffix.lower()
 
     data: Any
@@ -302,11 +379,13 @@ def load_policy(path: str | Path) -> Policy:
             raise RuntimeError(
                 "PyYAML is required to load YAML policies. Install with `pip install pyyaml`."
             )
-        data = yaml.safe_load(text)
+        data = yaml.load(raw_bytes, Loader=_YamlLoader)
     elif suffix == ".json":
-        data = json.loads(text)
+        data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
     else:
         raise ValueError(f"Unsupported policy format: {suffix}")
 
     payload = _normalize_policy_payload(data, p)
-    return Policy(**payload)
+    policy = Policy(**payload)
+    _POLICY_CACHE[cache_key] = (stamp[0], stamp[1], policy)
+    return policy
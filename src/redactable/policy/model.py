@@ -1,7 +1,9 @@
 # ruff: noqa: E402
 from __future__ import annotations
+import sys
+from functools import cached_property
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 Action = Literal["redact", "mask", "tokenize"]
 _ACTION_ALIASES = {
@@ -20,6 +22,8 @@ class Rule(BaseModel):
     One transformation applied to all Findings whose kind == field.
     Future: add 'where' filters (regex, confidence threshold, etc.).
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Rule identifier (unique within policy)")
     field: str = Field(..., description="Detector kind (e.g. email, credit_card, phone)")
     action: Action = Field(..., description="Transformation to apply")
@@ -44,13 +48,18 @@ class Rule(BaseModel):
         if isinstance(v, str):
             key = v.strip().lower()
             if key in _ACTION_ALIASES:
-                return _ACTION_ALIASES[key]
+                # The canonical names are interned literals, so action
+                # dispatch in the engine compares by pointer.
+                return sys.intern(_ACTION_ALIASES[key])
         return v
 
     @field_validator("field")
     @classmethod
     def _normalize_field(cls, v: str) -> str:
-        return v.strip().lower()
+        # Interned to match the detector kinds (also interned), so the
+        # per-finding dict lookups hit on pointer equality; casefold
+        # matches the loader's key normalization.
+        return sys.intern(v.strip().casefold())
 
     @field_validator("replacement")
     @classmethod
@@ -68,6 +77,10 @@ class Policy(BaseModel):
     description: optional human-friendly explanation.
     rules: ordered list; earlier rules do not block later ones (idempotent ops).
     """
+    # Frozen: policies are read-only after load, which makes the cached
+    # rule index below safe to share across threads and call sites.
+    model_config = ConfigDict(frozen=True)
+
     version: int = Field(..., ge=1, description="Policy schema version (>=1)")
     name: str = Field(..., min_length=1, description="Short policy name")
     description: Optional[str] = Field(default=None, description="Optional description")
@@ -78,7 +91,24 @@ class Policy(BaseModel):
     def _normalize_name(cls, v: str) -> str:
         return v.strip()
 
+    @cached_property
+    def rules_by_field(self) -> dict[str, tuple[Rule, ...]]:
+        """
+        Rules indexed by detector kind, in declaration order. Computed
+        once per Policy (the model is frozen): streaming callers apply
+        the same policy to every record, and the per-record path should
+        not rescan the rule list. Tuple values so the index can be
+        handed out without defensive copies.
+        """
+        index: dict[str, list[Rule]] = {}
+        for r in self.rules:
+            index.setdefault(r.field, []).append(r)
+        return {field: tuple(rules) for field, rules in index.items()}
+
     def by_field(self, field: str) -> list[Rule]:
         """Return all rules targeting a given detector kind."""
-        f = field.strip().lower()
-        return [r for r in self.rules if r.field == f]
+        return list(self.rules_by_field.get(field.strip().lower(), ()))
+
+    def referenced_fields(self) -> frozenset[str]:
+        """Detector kinds this policy acts on; lets callers skip the rest."""
+        return frozenset(self.rules_by_field)
@@ -0,0 +1,17 @@
+from typing import Iterable
+
+from redactable.detectors import Finding
+from redactable.policy import Policy, apply_policy
+
+
+def apply_all(text: str, findings: Iterable[Finding], policy: Policy) -> str:
+    """
+    Apply every policy rule to text in one fused pass.
+
+    Chaining mask_in_place/redact traverses the full text once per
+    transform; this dispatches each finding to its rule's action and
+    renders with a single sort and a single left-to-right walk. The
+    heavy lifting lives in the policy engine — this is the transforms
+    entry point for pipelines that work text-first.
+    """
+    return apply_policy(policy, findings, text)
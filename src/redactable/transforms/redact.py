@@ -1,13 +1,25 @@
+from operator import attrgetter
 from typing import Iterable
+
 from redactable.detectors import Finding
 
 def redact(text: str, findings: Iterable[Finding], placeholder_fmt: str = "[REDACTED:{kind}]") -> str:
     """
     Replace spans with a placeholder; assumes findings' spans are in original coordinates.
-    Applies from right-to-left to preserve offsets.
+    Single left-to-right pass; overlapping spans are skipped (earliest start wins).
     """
-    out = text
-    for f in sorted(findings, key=lambda x: x.span[0], reverse=True):
+    parts: list[str] = []
+    cursor = 0
+    placeholders: dict[str, str] = {}  # one format() per kind, not per finding
+    for f in sorted(findings, key=attrgetter("span")):
         start, end = f.span
-        out = out[:start] + placeholder_fmt.format(kind=f.kind.upper()) + out[end:]
-    return out
+        if start < cursor:
+            continue
+        placeholder = placeholders.get(f.kind)
+        if placeholder is None:
+            placeholder = placeholders[f.kind] = placeholder_fmt.format(kind=f.kind.upper())
+        parts.append(text[cursor:start])
+        parts.append(placeholder)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
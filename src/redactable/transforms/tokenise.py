@@ -1,14 +1,37 @@
+from functools import lru_cache
+from operator import attrgetter
 from typing import Iterable
+
 from redactable.detectors import Finding
 
+@lru_cache(maxsize=8)
+def _glyph_buf(glyph: str) -> str:
+    # One pre-filled run per glyph; slicing it is a single allocation
+    # instead of a fresh glyph * n multiplication per finding.
+    return glyph * 1024
+
+def _glyph_run(glyph: str, n: int) -> str:
+    if len(glyph) == 1 and n <= 1024:
+        return _glyph_buf(glyph)[:n]
+    return glyph * n
+
 def _mask(value: str, keep_head: int = 0, keep_tail: int = 4, glyph: str = "•") -> str:
     if len(value) <= keep_head + keep_tail:
-        return glyph * len(value)
-    return value[:keep_head] + glyph * (len(value) - keep_head - keep_tail) + value[-keep_tail:]
+        return _glyph_run(glyph, len(value))
+    return value[:keep_head] + _glyph_run(glyph, len(value) - keep_head - keep_tail) + value[-keep_tail:]
 
 def mask_in_place(text: str, findings: Iterable[Finding], keep_head: int = 0, keep_tail: int = 4, glyph: str = "•") -> str:
-    out = text
-    for f in sorted(findings, key=lambda x: x.span[0], reverse=True):
+    # Single left-to-right pass over sorted spans: the old right-to-left
+    # slice-concat copied the whole string once per finding. Overlapping
+    # spans are skipped deterministically (earliest start wins).
+    parts: list[str] = []
+    cursor = 0
+    for f in sorted(findings, key=attrgetter("span")):
         s, e = f.span
-        out = out[:s] + _mask(out[s:e], keep_head, keep_tail, glyph) + out[e:]
-    return out
+        if s < cursor:
+            continue
+        parts.append(text[cursor:s])
+        parts.append(_mask(text[s:e], keep_head, keep_tail, glyph))
+        cursor = e
+    parts.append(text[cursor:])
+    return "".join(parts)
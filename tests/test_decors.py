@@ -0,0 +1,25 @@
+from redactable.decors import redactable_io
+
+
+def test_redactable_io_masks_string_result():
+    @redactable_io(policy="gdpr.yaml")
+    def greet():
+        return "Customer email: test@example.com"
+
+    assert "****@example.com" in greet()
+
+
+def test_redactable_io_passes_through_non_string():
+    @redactable_io(policy="gdpr.yaml")
+    def numbers():
+        return [1, 2, 3]
+
+    assert numbers() == [1, 2, 3]
+
+
+def test_redactable_io_without_policy_is_identity():
+    @redactable_io()
+    def greet():
+        return "Customer email: test@example.com"
+
+    assert greet() == "Customer email: test@example.com"
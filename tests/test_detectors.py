@@ -41,3 +41,23 @@ def test_entropy():
     text = f"api key: {likely}"
     m = [x for x in run_all(text) if x.label == "SECRET"]
     assert len(m) >= 1
+
+def test_schema_hints():
+    schema = {"properties": {"Card-Number": {"type": "str"}, "notes": "free text"}}
+    m = run_all("", context={"schema": schema})
+    assert [(x.label, x.value) for x in m] == [("CREDIT_CARD", "Card-Number")]
+    assert m[0].meta["source"] == "schema"
+
+def test_rejected_span_falls_through():
+    # IBAN-shaped token with a bad checksum: the iban branch wins the
+    # alternation and rejects, but the span must still reach the
+    # entropy detector rather than vanish.
+    text = "key Ab12Xy9Qw8Er7Tt6Yy5Uu4Ii3Oo2P end"
+    m = [x for x in run_all(text) if x.label == "SECRET"]
+    assert any(x.value == "Ab12Xy9Qw8Er7Tt6Yy5Uu4Ii3Oo2P" for x in m)
+
+def test_unicode_digit_pan():
+    # str-mode \d matches Arabic-Indic digits; the linear-engine fast
+    # paths are ASCII-only and must dispatch such text to stdlib re.
+    m = [x for x in run_all("pan ٤١١١ ١١١١ ١١١١ ١١١١ end") if x.label == "CREDIT_CARD"]
+    assert len(m) == 1 and m[0].meta["digits"] == "4111111111111111"
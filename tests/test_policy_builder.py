@@ -0,0 +1,30 @@
+from redactable.policy import Policy, PolicyBuilder, Rule, apply_policy
+from redactable.detectors import Finding
+
+
+def test_builder_produces_valid_policy() -> None:
+    policy = (
+        PolicyBuilder("test", description="builder smoke")
+        .redact("email")
+        .mask("credit_card", keep_tail=4)
+        .tokenize("iban", salt="s")
+        .build()
+    )
+
+    assert isinstance(policy, Policy)
+    assert policy.name == "test"
+    assert [r.action for r in policy.rules] == ["redact", "mask", "tokenize"]
+    assert all(isinstance(r, Rule) for r in policy.rules)
+    # Built policies must behave like loaded ones.
+    text = "contact a@b.co"
+    findings = [Finding(kind="email", value="a@b.co", span=(8, 14), confidence=0.9)]
+    assert apply_policy(policy, findings, text) == "contact [REDACTED:EMAIL]"
+
+
+def test_builder_validates_rules_on_entry() -> None:
+    builder = PolicyBuilder("test")
+    builder.add({"id": "r1", "field": "Email ", "action": "tokenise"})
+
+    rule = builder.build().rules[0]
+    assert rule.field == "email"  # normalized by Rule validation
+    assert rule.action == "tokenize"
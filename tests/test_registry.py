@@ -0,0 +1,39 @@
+import pytest
+
+from redactable.detectors.registry import DetectorRegistry
+
+try:
+    import hyperscan  # type: ignore
+except Exception:  # pragma: no cover
+    hyperscan = None
+
+
+@pytest.mark.skipif(hyperscan is None, reason="hyperscan bindings not installed")
+def test_hyperscan_path_matches_re_path():
+    text = (
+        "mail bob@example.com card 4111 1111 1111 1111 "
+        "token Ab12Xy9Qw8Er7Tt6Yy5Uu4Ii3Oo2Pq end"
+    )
+    fast = DetectorRegistry.default()
+    fast.scan("probe")  # force database build
+    assert fast._db is not False, "no pattern survived the compile probe"
+    slow = DetectorRegistry.default()
+    slow._db = False  # per-detector re path only
+
+    def spans(findings):
+        return sorted((f.kind, f.span, f.normalized or f.value) for f in findings)
+
+    assert spans(fast.scan(text)) == spans(slow.scan(text))
+
+
+@pytest.mark.skipif(hyperscan is None, reason="hyperscan bindings not installed")
+def test_hyperscan_reports_whole_token():
+    # Hyperscan fires once per qualifying end offset on unbounded
+    # patterns; the collapse must hand the validator the longest span,
+    # not a prefix that leaves the tail unredacted.
+    secret = "Ab12Xy9Qw8Er7Tt6Yy5Uu4Ii3Oo2Pq0"
+    text = f"key {secret} end"
+    reg = DetectorRegistry.default()
+    hits = [f for f in reg.scan(text) if f.kind == "high_entropy_token"]
+    assert any(f.value == secret for f in hits)
+    assert all(f.span[1] - f.span[0] == len(f.value) for f in hits)